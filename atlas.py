@@ -0,0 +1,162 @@
+# Pre-rendered string atlas
+#
+# Recurring labels (day numbers, month names, section titles) are rendered
+# once, through the same Writer and framebuf code the Screen uses, into
+# packed 1-bit MONO_HLSB bitmaps and stored on flash. Screen then blits a
+# whole label from the atlas instead of rasterizing it glyph by glyph.
+#
+# A bitmap depends on the drawing method (displaylist TEXT, TEXT_SANS,
+# TEXT_COURIER), the string and a variant: the Writer invert flag for the
+# fonts, the colour for text(). Writer output covers the whole glyph boxes
+# and is blitted as is; text() only sets ink pixels, so its bitmaps have the
+# opposite colour as background and are blitted with that as the key.
+#
+# The file is keyed on the label list and the fingerprints of the fonts
+# (see Atlas.key()); load() refuses an atlas built under another key, so a
+# new label or a changed font gets the atlas rebuilt.
+#
+# File: MAGIC, key, entry count (u16), entries of kind (u8), variant (u8),
+# width (u16), height (u8), string length (u8), string, then the bitmaps in
+# entry order, rows padded to whole bytes.
+
+import framebuf
+import hashlib
+from displaylist import TEXT, TEXT_SANS, TEXT_COURIER, font_info
+from epaper import Screen, ScreenImage
+
+
+class Atlas:
+    MAGIC = b'AT2'
+    KEY_SIZE = 32       # sha256 digest
+    TEXT_HEIGHT = 8     # framebuf.text() glyphs are 8x8
+
+    def __init__(self, path='atlas.bin'):
+        self.path = path
+        self.entries = {}   # (kind, variant, string) -> (offset, width, height)
+        self.file = None
+        self.buf = None     # Largest bitmap, reused by every blit
+
+    @staticmethod
+    def _font(kind):
+        from filefont import load_font
+        return load_font(Screen.FONTS['sans' if kind == TEXT_SANS else 'courier'])
+
+    @staticmethod
+    def key(labels):
+        # Digest of [(kind, variant, string)] and the fonts they are drawn with
+        h = hashlib.sha256()
+        kinds = 0   # Bit per kind drawn
+        for kind, variant, string in labels:
+            kinds |= 1 << kind
+            h.update(bytes((kind, int(variant))))
+            h.update(string.encode())
+            h.update(b'\x00')
+        for kind in (TEXT_SANS, TEXT_COURIER):
+            if kinds & (1 << kind):
+                h.update(font_info(kind)[2])
+                h.update(b'\x00')
+        return h.digest()
+
+    def load(self, key=None):
+        # Read the index and keep the file open for blit(). False if the
+        # atlas is missing, unreadable or was built under another key.
+        self.close()
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return False
+        try:
+            if f.read(3) != Atlas.MAGIC:
+                raise ValueError('Not an atlas')
+            stored = f.read(Atlas.KEY_SIZE)
+            if key is not None and stored != key:
+                raise ValueError('Atlas is stale')
+            header = f.read(2)
+            entries = []
+            for _ in range(header[0] | header[1] << 8):
+                kind, variant, w0, w1, height, length = f.read(6)
+                entries.append((kind, variant, f.read(length).decode(), w0 | w1 << 8, height))
+        except (IndexError, ValueError):
+            f.close()
+            return False
+        offset = f.tell()
+        largest = 0
+        for kind, variant, string, width, height in entries:
+            self.entries[(kind, variant, string)] = (offset, width, height)
+            size = (width + 7) // 8 * height
+            offset += size
+            largest = max(largest, size)
+        self.buf = bytearray(largest)
+        self.file = f
+        return True
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+        self.buf = None
+        self.entries = {}
+
+    def get(self, kind, variant, string):
+        # (offset, width, height) of a stored bitmap, None if not stored
+        return self.entries.get((kind, variant, string))
+
+    def blit(self, image, entry, x, y, key=-1):
+        offset, width, height = entry
+        size = (width + 7) // 8 * height
+        self.file.seek(offset)
+        mv = memoryview(self.buf)[:size]
+        self.file.readinto(mv)
+        image.blit(framebuf.FrameBuffer(mv, width, height, framebuf.MONO_HLSB), x, y, key)
+
+    @staticmethod
+    def render(kind, variant, string):
+        # (width, height, packed bitmap) of a label as Screen draws it
+        if kind == TEXT:
+            width = len(string) * 8
+            height = Atlas.TEXT_HEIGHT
+            buf = bytearray((width + 7) // 8 * height)
+            fb = framebuf.FrameBuffer(buf, width, height, framebuf.MONO_HLSB)
+            fb.fill(0 if variant else 1)
+            fb.text(string, 0, 0, variant)
+            return width, height, buf
+
+        from writer import Writer
+        font = Atlas._font(kind)
+        width = 0
+        for c in string:
+            width += font.get_ch(c)[2]
+        height = font.height()
+        # The Writer needs a device taller than the font and wider than a glyph
+        device_width = max(width, font.max_width() + 1)
+        device_width = (device_width + 7) // 8 * 8
+        device = ScreenImage(bytearray(device_width // 8 * (height + 1)), device_width, height + 1)
+        writer = Writer(device, font, verbose=False)
+        Writer.set_textpos(device, 0, 0)
+        writer.printstring(string, invert=bool(variant))
+        Writer.state.pop(id(device), None)
+
+        stride = (width + 7) // 8
+        packed = bytearray(stride * height)
+        bitmap = framebuf.FrameBuffer(packed, width, height, framebuf.MONO_HLSB)
+        bitmap.blit(device, 0, 0)
+        return width, height, packed
+
+    @staticmethod
+    def build(path, labels, key=None):
+        # Render [(kind, variant, string)] and write the atlas to path
+        if key is None:
+            key = Atlas.key(labels)
+        bitmaps = []
+        with open(path, 'wb') as f:
+            f.write(Atlas.MAGIC)
+            f.write(key)
+            f.write(bytes((len(labels) & 0xff, len(labels) >> 8)))
+            for kind, variant, string in labels:
+                width, height, bitmap = Atlas.render(kind, variant, string)
+                data = string.encode()
+                f.write(bytes((kind, int(variant), width & 0xff, width >> 8, height, len(data))))
+                f.write(data)
+                bitmaps.append(bitmap)
+            for bitmap in bitmaps:
+                f.write(bitmap)
@@ -0,0 +1,55 @@
+# Boot-time buffer pool
+#
+# Large buffers are reserved right after boot, while the heap is still in
+# one piece, and handed to their consumers (Screen, ...) later. Allocating
+# them after TLS, JSON parsing and font imports have fragmented the heap is
+# where MemoryErrors come from.
+
+import gc
+
+
+class BufferPool:
+    def __init__(self):
+        self.buffers = {}
+
+    def reserve(self, name, size):
+        buf = self.buffers.get(name)
+        if buf is None or len(buf) != size:
+            self.buffers[name] = None
+            gc.collect()
+            buf = bytearray(size)
+            self.buffers[name] = buf
+        return buf
+
+    def get(self, name):
+        return self.buffers.get(name)
+
+    def release(self, name):
+        self.buffers.pop(name, None)
+
+    def size(self):
+        total = 0
+        for buf in self.buffers.values():
+            total += len(buf)
+        return total
+
+
+def largest_free(limit=None):
+    # Largest block that can currently be allocated: binary search over
+    # trial allocations, collecting before each one
+    gc.collect()
+    lo = 0
+    hi = gc.mem_free()
+    if limit is not None and limit < hi:
+        hi = limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        gc.collect()
+        try:
+            buf = bytearray(mid)
+            del buf
+            lo = mid
+        except MemoryError:
+            hi = mid - 1
+    gc.collect()
+    return lo
@@ -1,36 +1,93 @@
 from epaper import Screen
-import time
+from displaylist import TEXT, TEXT_COURIER
+from array import array
 
 
 class DateUtil:
+    # Dates are time.localtime() style tuples (year, month, mday, hour,
+    # minute, second, weekday, yearday), computed with integer arithmetic on
+    # day numbers (days since 1970-01-01) instead of mktime()/localtime()
     months = ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']
     days_of_week = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     days_in_months = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
     
+    month_lengths = {}  # (year, month) -> days
+    nice_cache = {}     # (year, month, mday) -> date_to_nice() string
+    
+    @staticmethod
+    def is_leap(year):
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    
+    @staticmethod
+    def month_length(year, month):
+        days = DateUtil.month_lengths.get((year, month))
+        if days is None:
+            days = DateUtil.days_in_months[month - 1]
+            if month == 2 and DateUtil.is_leap(year):
+                days = 29
+            DateUtil.month_lengths[(year, month)] = days
+        return days
+    
+    @staticmethod
+    def days_from_civil(year, month, mday):
+        # Day number of a proleptic Gregorian date, 1970-01-01 is 0
+        if month <= 2:
+            year -= 1
+        era = year // 400
+        yoe = year - era * 400
+        doy = (153 * (month + 9 if month <= 2 else month - 3) + 2) // 5 + mday - 1
+        doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+        return era * 146097 + doe - 719468
+    
+    @staticmethod
+    def civil_from_days(days):
+        # (year, month, mday) of a day number
+        days += 719468
+        era = days // 146097
+        doe = days - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        mday = doy - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        year = yoe + era * 400 + (1 if month <= 2 else 0)
+        return year, month, mday
+    
+    @staticmethod
+    def from_days(days, hour=0, minute=0, second=0):
+        # localtime() style tuple of a day number
+        year, month, mday = DateUtil.civil_from_days(days)
+        weekday = (days + 3) % 7     # 1970-01-01 was a Thursday
+        yearday = days - DateUtil.days_from_civil(year, 1, 1) + 1
+        return (year, month, mday, hour, minute, second, weekday, yearday)
+    
     @staticmethod
     def date_to_iso(dt_tuple):
         return '{year:02d}-{month:02d}-{day:02d}'.format(year=dt_tuple[0], month=dt_tuple[1], day=dt_tuple[2])
     
     @staticmethod
     def add_days(dt_tuple, days=1):
-        dt_seconds = time.mktime(dt_tuple)
-        dt_seconds += days * 60 * 60 * 24
-        return time.localtime(dt_seconds)
+        days += DateUtil.days_from_civil(dt_tuple[0], dt_tuple[1], dt_tuple[2])
+        return DateUtil.from_days(days, dt_tuple[3], dt_tuple[4], dt_tuple[5])
     
     @staticmethod
     def iso_to_date(iso_string):
-        just_date = iso_string.split('T')[0]
-        date_components = just_date.split('-')
-        dt_seconds = time.mktime((int(date_components[0]), int(date_components[1]), int(date_components[2]), 12, 00, 0, 0, 0))
-        dt = time.localtime(dt_seconds)
-        return dt
+        # Noon of the date part of an ISO 8601 string
+        date_components = iso_string.split('T')[0].split('-')
+        days = DateUtil.days_from_civil(int(date_components[0]), int(date_components[1]), int(date_components[2]))
+        return DateUtil.from_days(days, 12)
     
     @staticmethod
     def date_to_nice(dt_tuple):
-        return '{dow}, the {day} of {month}'.format(
-            dow=DateUtil.days_of_week[dt_tuple[6]],
-            day=dt_tuple[2],
-            month=DateUtil.months[dt_tuple[1]-1])
+        key = (dt_tuple[0], dt_tuple[1], dt_tuple[2])
+        nice = DateUtil.nice_cache.get(key)
+        if nice is None:
+            nice = '{dow}, the {day} of {month}'.format(
+                dow=DateUtil.days_of_week[dt_tuple[6]],
+                day=dt_tuple[2],
+                month=DateUtil.months[dt_tuple[1]-1])
+            DateUtil.nice_cache[key] = nice
+        return nice
         
     @staticmethod
     def iso_to_nice(iso_string):
@@ -42,10 +99,86 @@ class DateUtil:
         return dt1[0] == dt2[0] and dt1[1] == dt2[1] and dt1[2] == dt2[2]
 
 
+class MonthGrid:
+    # Where each day of a month goes in the calendar grid. Only changes once
+    # a month, so it is kept in memory and on flash, keyed by year, month
+    # and the screen's x_middle. cells holds y, x | WEEKEND per day.
+    PATH = 'month_grid.bin'     # None: memory only
+    MAGIC = b'MG1'
+    WEEKEND = 0x8000
+    FIRST_ROW_PX = 70
+    
+    cache = {}  # (year, month, x_middle) -> MonthGrid
+    
+    def __init__(self, year, month, x_middle):
+        self.key = (year, month, x_middle)
+        self.days = DateUtil.month_length(year, month)
+        self.weekday_1st = (DateUtil.days_from_civil(year, month, 1) + 3) % 7
+        self.col_width_px = Calendar.LETTER_WIDTH * 3
+        self.left_px = int(x_middle - self.col_width_px * 7 / 2)
+        self.cells = array('H', bytes(4 * self.days))
+        
+    def layout(self):
+        cells = self.cells
+        wday = self.weekday_1st
+        day_row = 1
+        for i in range(0, 2 * self.days, 2):
+            cells[i] = MonthGrid.FIRST_ROW_PX + Calendar.LETTER_HEIGHT * day_row
+            cells[i + 1] = (self.left_px + wday * self.col_width_px) | (MonthGrid.WEEKEND if wday >= 5 else 0)
+            wday += 1
+            if wday > 6:
+                wday = 0
+                day_row += 1
+    
+    def y(self, mday):
+        return self.cells[2 * mday - 2]
+    
+    def x(self, mday):
+        return self.cells[2 * mday - 1] & ~MonthGrid.WEEKEND
+    
+    def weekend(self, mday):
+        return self.cells[2 * mday - 1] & MonthGrid.WEEKEND != 0
+    
+    def save(self, path):
+        year, month, x_middle = self.key
+        with open(path, 'wb') as f:
+            f.write(MonthGrid.MAGIC)
+            f.write(bytes((year & 0xff, year >> 8, month, x_middle & 0xff, x_middle >> 8)))
+            f.write(self.cells)
+    
+    def load(self, path):
+        # Fill cells from path if it holds this month's grid
+        year, month, x_middle = self.key
+        try:
+            with open(path, 'rb') as f:
+                if f.read(8) != MonthGrid.MAGIC + bytes((year & 0xff, year >> 8, month, x_middle & 0xff, x_middle >> 8)):
+                    return False
+                return f.readinto(self.cells) == len(self.cells) * 2
+        except OSError:
+            return False
+    
+    @staticmethod
+    def get(year, month, x_middle):
+        key = (year, month, x_middle)
+        grid = MonthGrid.cache.get(key)
+        if grid is None:
+            grid = MonthGrid(year, month, x_middle)
+            if MonthGrid.PATH is None or not grid.load(MonthGrid.PATH):
+                grid.layout()
+                if MonthGrid.PATH is not None:
+                    grid.save(MonthGrid.PATH)
+            MonthGrid.cache[key] = grid
+        return grid
+
+
 class Calendar:
     LETTER_HEIGHT = 20
     LETTER_WIDTH = 13
     
+    EVENT_MARK = 4      # Size of the square marking a day with events
+    EVENTS_ROW = 34     # Text row of the upcoming events list
+    EVENTS_SHOWN = 8
+    
     def __init__(self, screen, today_dt_tuple):
         self.screen = screen
         self.today = today_dt_tuple
@@ -66,39 +199,38 @@ class Calendar:
         self.mday = self.today[2]
         self.weekday = self.today[6]
         
-        self.day_coordinates = []
-        
-        week_excess_from_1st = (self.mday - 1) % 7
-        self.weekday_1st = (self.weekday - week_excess_from_1st + 7) % 7
-        
-        day_col_width_px = Calendar.LETTER_WIDTH * 3
-        first_day_col_start_px = int(self.screen.x_middle - day_col_width_px * 7 / 2)
-        first_day_row_start_px = 70
+        # Day positions, shared by draw_calendar and draw_garbage
+        self.grid = MonthGrid.get(self.year, self.month, int(self.screen.x_middle))
+        self.weekday_1st = self.grid.weekday_1st
+        self.days = self.grid.days
+        self.left_border_px = self.grid.left_px
+        self.first_day = DateUtil.days_from_civil(self.year, self.month, 1)
         
-        self.left_border_px = first_day_col_start_px
+        # What is on each day of the month (recur.DayIndex), filled by
+        # draw_garbage and draw_events
+        self.garbage_days = None
+        self.event_days = None
         
-        self.days = DateUtil.days_in_months[self.month - 1]
-        wday = self.weekday_1st
-        if self.month == 2:
-            # Check for leap year
-            if self.year % 400 == 0:
-                self.days = 29
-            elif self.year % 100 == 0:
-                pass
-            elif self.year % 4 == 0:
-                self.days = 29
-        
-        day_row = 1
-        day = 1
-        while day <= self.days:
-            self.day_coordinates.append((first_day_row_start_px + Calendar.LETTER_HEIGHT * day_row, first_day_col_start_px + wday * day_col_width_px))
-            
-            day += 1
-            wday += 1
-            if wday > 6:
-                wday = 0
-                day_row += 1
+    def month_index(self, spans):
+        # DayIndex of (first_day, last_day, item) spans over this month
+        from recur import DayIndex
+        return DayIndex(self.first_day, self.days, spans)
         
+    @staticmethod
+    def atlas_labels():
+        # Labels drawn every cycle, pre-rendered by atlas.Atlas.build(): day
+        # numbers (plain and inverse), month names and section titles
+        labels = []
+        for day in range(1, 32):
+            day_str = str(day)
+            if len(day_str) == 1: day_str = ' ' + day_str
+            labels.append((TEXT_COURIER, True, day_str))
+            labels.append((TEXT_COURIER, False, day_str))
+        for month in DateUtil.months:
+            labels.append((TEXT_COURIER, True, month))
+        for title in ('Garbage schedule', 'Nothing planned!', 'Weather forecast', 'Today', 'Tomorrow', 'Day after', 'Upcoming'):
+            labels.append((TEXT, 0x00, title))
+        return labels
         
     def draw_garbage(self, garbage_schedule):
         tomorrow = DateUtil.add_days(self.today)
@@ -111,7 +243,8 @@ class Calendar:
             print_row = 12
             self.announce_gs_today = False
             self.announce_gs_tomorrow = False
-            for item in garbage_schedule:
+            spans = []
+            for n, item in enumerate(garbage_schedule):
                 _td = DateUtil.dates_equal(item['date'], self.today)
                 _tm = DateUtil.dates_equal(item['date'], tomorrow)
                 self.announce_gs_today = self.announce_gs_today or _td
@@ -121,11 +254,18 @@ class Calendar:
                 self.screen.text(item['date_format'], print_row, 5, red)
                 self.screen.text(item['type'], print_row + 1, 5, red)
                 
-                if item['date'][1] == self.month:
-                    coordinate = self.day_coordinates[item['date'][2] - 1]
-                    self.screen.imagered.hline(coordinate[1], coordinate[0] + Calendar.LETTER_HEIGHT - 2, Calendar.LETTER_WIDTH * 2, 0xff)
-                    self.screen.imagered.hline(coordinate[1], coordinate[0] + Calendar.LETTER_HEIGHT - 1, Calendar.LETTER_WIDTH * 2, 0xff)
+                day = DateUtil.days_from_civil(item['date'][0], item['date'][1], item['date'][2])
+                spans.append((day, day, n))
                 print_row += 3
+            
+            # Underline collection days
+            self.garbage_days = self.month_index(spans)
+            for day in range(1, self.days + 1):
+                if self.garbage_days.has(day):
+                    x = self.grid.x(day)
+                    y = self.grid.y(day)
+                    self.screen.hline(x, y + Calendar.LETTER_HEIGHT - 2, Calendar.LETTER_WIDTH * 2, red=True)
+                    self.screen.hline(x, y + Calendar.LETTER_HEIGHT - 1, Calendar.LETTER_WIDTH * 2, red=True)
                 
     def draw_weather(self, forecast):
         
@@ -170,27 +310,52 @@ class Calendar:
             weather_top += 1
             weather_top_px += 10
                 
+    def draw_events(self, events):
+        # Mark the days of (first_day, last_day, summary) events (see ics.py)
+        # in the grid and list the upcoming ones below the announcements
+        if len(events) == 0:
+            return
+        
+        today = self.first_day + self.mday - 1
+        grid = self.grid
+        self.event_days = self.month_index([(events[n][0], events[n][1], n) for n in range(len(events))])
+        for day in range(1, self.days + 1):
+            if self.event_days.has(day):
+                x = grid.x(day) + Calendar.LETTER_WIDTH * 2 + 2
+                y = grid.y(day) + (Calendar.LETTER_HEIGHT - Calendar.EVENT_MARK) // 2
+                for row in range(Calendar.EVENT_MARK):
+                    self.screen.hline(x, y + row, Calendar.EVENT_MARK)
+        
+        col = (self.left_border_px - 1) // 10 + 1
+        width = 54 - col    # Up to the weather column
+        row = Calendar.EVENTS_ROW
+        shown = 0
+        for first_day, last_day, summary in events:
+            if last_day < today:
+                continue
+            if shown == 0:
+                self.screen.text('Upcoming', row, col)
+                row += 2
+            year, month, mday = DateUtil.civil_from_days(max(first_day, today))
+            line = '{:2d}/{:02d} {}'.format(mday, month, summary)
+            self.screen.text(line[:width], row, col, first_day <= today)
+            row += 1
+            shown += 1
+            if shown == Calendar.EVENTS_SHOWN:
+                break
+
     def draw_calendar(self):
         self.screen.text_sans(str(self.year), 5, self.screen.x_middle - Calendar.LETTER_WIDTH * 2)        
         self.screen.text_courier(DateUtil.months[self.month - 1], 35, int(self.screen.x_middle - Calendar.LETTER_WIDTH * len(DateUtil.months[self.month - 1]) / 2))
         
-        day = 1
-        wday = self.weekday_1st
-        day_row = 1
-        while day <= self.days:
+        grid = self.grid
+        for day in range(1, self.days + 1):
             day_str = str(day)
             if len(day_str) == 1: day_str = ' ' + day_str
-            coordinate = self.day_coordinates[day - 1]
             self.screen.text_courier(day_str,
-                                     coordinate[0], coordinate[1],
-                                     red=(wday in [5,6]),
+                                     grid.y(day), grid.x(day),
+                                     red=grid.weekend(day),
                                      inverse=(day == self.mday))
-            
-            day += 1
-            wday += 1
-            if wday > 6:
-                wday = 0
-                day_row += 1
                 
     def draw_announcements(self):
         if not self.announce_gs_today and not self.announce_gs_tomorrow and not self.announce_precip_today and not self.announce_precip_tomorrow:
@@ -0,0 +1,208 @@
+# Retained display list
+#
+# Records the drawing calls Calendar makes on a Screen (text, text_sans,
+# text_courier, hline) in a compact array: four signed 16-bit words per
+# operation (op and flags, x, y, string index or width) plus a table of the
+# distinct strings. A recorded frame can be replayed into anything with the
+# same drawing methods (a Screen, a banded Screen, another DisplayList),
+# hashed before it is rasterized, saved to flash and compared with the
+# previous cycle's list to find the regions that changed.
+
+from array import array
+import hashlib
+
+TEXT = 0
+TEXT_SANS = 1
+TEXT_COURIER = 2
+HLINE = 3
+
+RED = 0x10
+INVERSE = 0x20
+
+
+def font_info(kind):
+    # (height, max_width, fingerprint) of the font operations of kind
+    # TEXT_SANS or TEXT_COURIER draw with (see filefont.font_info())
+    from epaper import Screen
+    import filefont
+    return filefont.font_info(Screen.FONTS['sans' if kind == TEXT_SANS else 'courier'])
+
+
+class DisplayList:
+    FIELDS = 4
+    MAGIC = b'DL1'
+
+    def __init__(self, width=800, height=480):
+        self.width = width
+        self.height = height
+        self.x_middle = int(width / 2)
+        self.ops = array('h')
+        self.strings = []
+        self.string_index = {}
+        self.text_row = 1   # Next row of text() with row=0, as on Screen
+
+    def __len__(self):
+        return len(self.ops) // DisplayList.FIELDS
+
+    def clear(self):
+        self.ops = array('h')
+        self.strings = []
+        self.string_index = {}
+        self.text_row = 1
+
+    def _string(self, text_str):
+        index = self.string_index.get(text_str)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(text_str)
+            self.string_index[text_str] = index
+        return index
+
+    def _add(self, op, x, y, arg):
+        ops = self.ops
+        ops.append(op)
+        ops.append(x)
+        ops.append(y)
+        ops.append(arg)
+
+    # Recording, same signatures as Screen
+
+    def text(self, text_str, row=0, col=1, red=False):
+        if row <= 0:
+            row = self.text_row
+            self.text_row += 1
+        self._add(TEXT | (RED if red else 0), col, row, self._string(text_str))
+
+    def text_sans(self, text_str, row, col, red=False):
+        self._add(TEXT_SANS | (RED if red else 0), col, row, self._string(text_str))
+
+    def text_courier(self, text_str, row, col, red=False, inverse=False):
+        self._add(TEXT_COURIER | (RED if red else 0) | (INVERSE if inverse else 0),
+                  col, row, self._string(text_str))
+
+    def hline(self, x, y, w, red=False):
+        self._add(HLINE | (RED if red else 0), x, y, w)
+
+    # Use
+
+    def replay(self, target, start=0, end=None):
+        # Draw operations start..end - 1 (all by default) on target
+        ops = self.ops
+        strings = self.strings
+        end = len(self) if end is None else end
+        for i in range(start * DisplayList.FIELDS, end * DisplayList.FIELDS, DisplayList.FIELDS):
+            op = ops[i]
+            kind = op & 0x0f
+            red = op & RED != 0
+            if kind == TEXT:
+                target.text(strings[ops[i + 3]], ops[i + 2], ops[i + 1], red)
+            elif kind == TEXT_SANS:
+                target.text_sans(strings[ops[i + 3]], ops[i + 2], ops[i + 1], red)
+            elif kind == TEXT_COURIER:
+                target.text_courier(strings[ops[i + 3]], ops[i + 2], ops[i + 1], red, op & INVERSE != 0)
+            elif kind == HLINE:
+                target.hline(ops[i + 1], ops[i + 2], ops[i + 3], red)
+
+    def hash(self, start=0, end=None):
+        # Digest of the content of operations start..end - 1 (the whole
+        # frame by default): the operations, the strings they draw and the
+        # fonts they draw them with
+        end = len(self) if end is None else end
+        ops = self.ops
+        h = hashlib.sha256()
+        h.update(memoryview(ops)[start * DisplayList.FIELDS:end * DisplayList.FIELDS])
+        kinds = 0   # Bit per kind drawn
+        for i in range(start * DisplayList.FIELDS, end * DisplayList.FIELDS, DisplayList.FIELDS):
+            kind = ops[i] & 0x0f
+            if kind != HLINE:
+                kinds |= 1 << kind
+                h.update(self.strings[ops[i + 3]].encode())
+                h.update(b'\x00')
+        for kind in (TEXT_SANS, TEXT_COURIER):
+            if kinds & (1 << kind):
+                h.update(font_info(kind)[2])
+                h.update(b'\x00')
+        return h.digest()
+
+    def bounds(self, n):
+        # Conservative (x, y, w, h) of operation n
+        i = n * DisplayList.FIELDS
+        kind = self.ops[i] & 0x0f
+        x = self.ops[i + 1]
+        y = self.ops[i + 2]
+        if kind == HLINE:
+            return x, y, self.ops[i + 3], 1
+        length = len(self.strings[self.ops[i + 3]])
+        if kind == TEXT:
+            return 1 + (x - 1) * 10, 1 + (y - 1) * 10, length * 8, 8
+        height, max_width, _ = font_info(kind)
+        w = length * max_width
+        if x + w > self.width:
+            # May wrap onto the following rows
+            return 0, y, self.width, self.height - y
+        return x, y, w, height
+
+    def rows(self, start=0, end=None):
+        # (first, last + 1) screen rows operations start..end - 1 may touch
+        end = len(self) if end is None else end
+        first = self.height
+        last = 0
+        for n in range(start, end):
+            x, y, w, h = self.bounds(n)
+            first = min(first, y)
+            last = max(last, y + h)
+        return max(first, 0), min(max(last, first), self.height)
+
+    def _keys(self):
+        # Operation n -> hashable key of its content
+        ops = self.ops
+        keys = []
+        for i in range(0, len(ops), DisplayList.FIELDS):
+            last = ops[i + 3] if ops[i] & 0x0f == HLINE else self.strings[ops[i + 3]]
+            keys.append((ops[i], ops[i + 1], ops[i + 2], last))
+        return keys
+
+    def changed_regions(self, previous):
+        # Bounding boxes of operations present in only one of the two lists.
+        # None when there is no previous list to compare with.
+        if previous is None:
+            return None
+        mine = self._keys()
+        theirs = previous._keys()
+        mine_set = set(mine)
+        theirs_set = set(theirs)
+        regions = []
+        for n, key in enumerate(mine):
+            if key not in theirs_set:
+                regions.append(self.bounds(n))
+        for n, key in enumerate(theirs):
+            if key not in mine_set:
+                regions.append(previous.bounds(n))
+        return regions
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(DisplayList.MAGIC)
+            f.write(bytes((len(self.strings) & 0xff, len(self.strings) >> 8)))
+            for s in self.strings:
+                data = s.encode()
+                f.write(bytes((len(data) & 0xff, len(data) >> 8)))
+                f.write(data)
+            f.write(self.ops)
+
+    @staticmethod
+    def load(path, width=800, height=480):
+        # The list saved at path, None if there is none or it is unreadable
+        try:
+            with open(path, 'rb') as f:
+                if f.read(3) != DisplayList.MAGIC:
+                    return None
+                header = f.read(2)
+                dl = DisplayList(width, height)
+                for _ in range(header[0] | header[1] << 8):
+                    length = f.read(2)
+                    dl._string(f.read(length[0] | length[1] << 8).decode())
+                dl.ops = array('h', f.read())
+            return dl
+        except (OSError, IndexError, ValueError):
+            return None
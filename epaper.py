@@ -1,11 +1,13 @@
 # Waveshare E-Paper 7.5B interface
 
-from machine import Pin, SPI
+from machine import Pin, idle
 import framebuf
 import utime
+from timing import PhaseTimer
+from transport import Transport
 from writer import Writer
-import freesans20
-import courier20
+from displaylist import TEXT, TEXT_SANS, TEXT_COURIER
+from filefont import load_font
 import gc
 
 
@@ -18,6 +20,41 @@ class ScreenImage(framebuf.FrameBuffer):
         super().__init__(self.buffer, self.width, self.height, self.mode)
         
 
+class BandImage(ScreenImage):
+    # A strip of rows of a taller image. Drawing takes full image coordinates
+    # and is shifted by the strip's top row; the framebuffer clips the rest.
+    # height is the full image height so Writer positions and wraps as usual.
+    def __init__(self, buffer, width, height, rows):
+        super().__init__(buffer, width, rows)
+        self.height = height
+        self.rows = rows
+        self.top = 0
+
+    def pixel(self, x, y, *c):
+        return super().pixel(x, y - self.top, *c)
+
+    def hline(self, x, y, w, c):
+        super().hline(x, y - self.top, w, c)
+
+    def vline(self, x, y, h, c):
+        super().vline(x, y - self.top, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        super().line(x1, y1 - self.top, x2, y2 - self.top, c)
+
+    def rect(self, x, y, w, h, c, *f):
+        super().rect(x, y - self.top, w, h, c, *f)
+
+    def fill_rect(self, x, y, w, h, c):
+        super().fill_rect(x, y - self.top, w, h, c)
+
+    def text(self, s, x, y, c=1):
+        super().text(s, x, y - self.top, c)
+
+    def blit(self, fbuf, x, y, *args):
+        super().blit(fbuf, x, y - self.top, *args)
+
+
 class Screen:
     # Display resolution
     EPD_WIDTH       = 800
@@ -31,7 +68,29 @@ class Screen:
     EPD_TEXT_WIDTH = 80
     EPD_TEXT_HEIGHT = 48
 
-    def __init__(self, external_black_buffer, external_red_buffer):
+    SCRATCH_SIZE = 16   # Bytes of preallocated command payload scratch
+    FILL_SIZE = 400     # Bytes of the repeated buffer behind constant fills
+    BUSY_TIMEOUT_MS = 60000  # Longest BUSY may stay low before we give up
+
+    # Font of each text style, loaded (see filefont.py) when first used
+    FONTS = {'sans': 'freesans20', 'courier': 'courier20'}
+
+    # Controller init sequence: command, payload length, payload.
+    # INIT_WAIT in the length byte: wait for BUSY to clear afterwards.
+    INIT_WAIT = 0x80
+    INIT_SEQUENCE = (
+        b'\x06\x04\x17\x17\x28\x17'      # btst. If an exception is displayed, try 0x38 for 0x28
+        # b'\x01\x04\x07\x07\x3f\x3f'    # POWER SETTING: VGH=20V,VGL=-20V, VDH=15V, VDL=-15V
+        b'\x04\x80'                      # POWER ON
+        b'\x00\x01\x0f'                  # PANNEL SETTING: KW-3f KWR-2F BWROTP 0f BWOTP 1f
+        b'\x61\x04\x03\x20\x01\xe0'      # tres: source 800, gate 480
+        b'\x15\x01\x00'
+        b'\x50\x02\x11\x07'              # VCOM AND DATA INTERVAL SETTING
+        b'\x60\x01\x22'                  # TCON SETTING
+        b'\x65\x04\x00\x00\x00\x00'      # Resolution setting: 800*480
+    )
+
+    def __init__(self, external_black_buffer, external_red_buffer, frame_store=None, band_rows=None, transport=None, atlas=None):
         self.reset_pin = Pin(Screen.RST_PIN, Pin.OUT)
         
         self.busy_pin = Pin(Screen.BUSY_PIN, Pin.IN, Pin.PULL_UP)
@@ -40,23 +99,60 @@ class Screen:
         self.height = Screen.EPD_HEIGHT
         self.x_middle = int(self.width / 2)
         self.text_row = 1
+        self.transfer_ms = 0
+        self.timing = PhaseTimer()  # Per-phase microseconds and bytes sent
+        self.refresh_mark = None    # timing mark of a refresh not yet waited for
         
-        self.buffer_black = external_black_buffer or bytearray(self.height * self.width // 8)
-        self.buffer_red = external_red_buffer or bytearray(self.height * self.width // 8)
+        # Optional framestore.FrameStore: unchanged frames skip the refresh
+        self.frame_store = frame_store
+        self.changed = None     # Changed (x, y, w, h) boxes of the last display()
         
-        self.imageblack = ScreenImage(self.buffer_black, self.width, self.height)
-        self.imagered = ScreenImage(self.buffer_red, self.width, self.height)
+        # Optional loaded atlas.Atlas: stored labels are blitted whole
+        self.atlas = atlas
+        
+        self.idle_flag = None   # uasyncio.ThreadSafeFlag while wait_idle() runs
+        self.busy_seen = False  # Set by the BUSY falling edge in busy_handshake()
+        
+        if( self.width % 8 == 0) :
+            self.line_bytes = self.width // 8
+        else :
+            self.line_bytes = self.width // 8 + 1
+        self.plane_bytes = self.line_bytes * self.height
+        
+        # Banded mode: the planes hold band_rows rows, see render_bands()
+        self.band_rows = band_rows
+        self.band_image = None  # Image being streamed by render_bands()
+        rows = band_rows or self.height
+        
+        self.buffer_black = external_black_buffer or bytearray(rows * self.line_bytes)
+        self.buffer_red = external_red_buffer or bytearray(rows * self.line_bytes)
+        
+        if band_rows:
+            self.imageblack = BandImage(self.buffer_black, self.width, self.height, rows)
+            self.imagered = BandImage(self.buffer_red, self.width, self.height, rows)
+        else:
+            self.imageblack = ScreenImage(self.buffer_black, self.width, self.height)
+            self.imagered = ScreenImage(self.buffer_red, self.width, self.height)
         self.imageblack.fill(0xff)
         self.imagered.fill(0x00)
         
-        self.writer_sans_black = Writer(self.imageblack, freesans20)
-        self.writer_sans_red = Writer(self.imagered, freesans20)
-        self.writer_courier_black = Writer(self.imageblack, courier20)
-        self.writer_courier_red = Writer(self.imagered, courier20)
+        # (style, red) -> Writer, created by writer() on first use
+        self.writers = {}
     
-        self.spi = SPI(1)
-        self.spi.init(baudrate=4000_000)
+        # SPI bus, baud rate and chunk size, see transport.py
+        self.transport = transport or Transport()
+        self.spi = self.transport.spi
         self.dc_pin = Pin(Screen.DC_PIN, Pin.OUT)        
+        
+        # Preallocated command/payload buffers and views of every payload
+        # length, so controller exchanges don't allocate per call
+        self.command_buf = bytearray(1)
+        self.scratch = bytearray(Screen.SCRATCH_SIZE)
+        scratch_mv = memoryview(self.scratch)
+        self.scratch_views = [scratch_mv[:n] for n in range(Screen.SCRATCH_SIZE + 1)]
+        self.window_buf = bytearray(9)
+        self.fill_buf = bytearray(Screen.FILL_SIZE)
+        self.fill_value = 0x00
 
         self.init()
         
@@ -67,21 +163,73 @@ class Screen:
         if col + len(text_str) > Screen.EPD_TEXT_WIDTH: return
         
         image = self.imageblack if not red else self.imagered
+        y = 1 + (display_row - 1) * 10
         
-        image.text(text_str, 1 + (col - 1) * 10, 1 + (display_row - 1) * 10, 0x00 if not red else 0xff)
+        color = 0x00 if not red else 0xff
+        if not self.blit_label(image, TEXT, color, text_str, 1 + (col - 1) * 10, y, 1 if not red else 0):
+            if self.in_band(image, y, 8):
+                image.text(text_str, 1 + (col - 1) * 10, y, color)
         if row == 0: self.text_row += 1
         
     def text_sans(self, text_str, row, col, red=False):
         image = self.imageblack if not red else self.imagered
-        writer = self.writer_sans_black if not red else self.writer_sans_red
+        if self.blit_label(image, TEXT_SANS, not red, text_str, col, row): return
+        writer = self.writer('sans', red)
+        if not self.in_band(image, row, writer.height, writer, text_str, col): return
         Writer.set_textpos(image, row, col)
         writer.printstring(text_str, invert=not red)        
 
     def text_courier(self, text_str, row, col, red=False, inverse=False):
         image = self.imageblack if not red else self.imagered
-        writer = self.writer_courier_black if not red else self.writer_courier_red
+        invert = not red if not inverse else red
+        if self.blit_label(image, TEXT_COURIER, invert, text_str, col, row): return
+        writer = self.writer('courier', red)
+        if not self.in_band(image, row, writer.height, writer, text_str, col): return
         Writer.set_textpos(image, row, col)
-        writer.printstring(text_str, invert=not red if not inverse else red)
+        writer.printstring(text_str, invert=invert)
+        
+    def hline(self, x, y, w, red=False):
+        image = self.imageblack if not red else self.imagered
+        if self.in_band(image, y, 1):
+            image.hline(x, y, w, 0x00 if not red else 0xff)
+        
+    def writer(self, style, red=False):
+        # Writer of a style on the black or red image, loading its font the
+        # first time the pair is used
+        key = (style, red)
+        writer = self.writers.get(key)
+        if writer is None:
+            image = self.imageblack if not red else self.imagered
+            writer = Writer(image, load_font(Screen.FONTS[style]), verbose=False)
+            self.writers[key] = writer
+        return writer
+        
+    def blit_label(self, image, kind, variant, text_str, x, y, key=-1):
+        # Draw text_str from the atlas if it is stored there and fits on the
+        # screen as one line (skipped if outside the band being rendered).
+        # False if it has to be rasterized.
+        if self.atlas is None:
+            return False
+        entry = self.atlas.get(kind, variant, text_str)
+        if entry is None or x + entry[1] > self.width or y + entry[2] > self.height:
+            return False
+        if self.in_band(image, y, entry[2]):
+            self.atlas.blit(image, entry, x, y, key)
+        return True
+        
+    def in_band(self, image, y, height, writer=None, text_str=None, col=0):
+        # Whether drawing rows y..y + height - 1 into image can touch the band
+        # render_bands() is streaming. Always True outside banded rendering.
+        if self.band_image is None:
+            return True
+        if image is not self.band_image:
+            return False
+        if y >= image.top + image.rows:
+            return False
+        if y + height > image.top:
+            return True
+        # Above the band: only word wrap could bring text down into it
+        return writer is not None and col + writer.stringlen(text_str) > self.width
         
     def digital_write(self, pin, value):
         pin.value(value)
@@ -90,180 +238,399 @@ class Screen:
         return pin.value()
 
     def delay_ms(self, delaytime):
-        utime.sleep(delaytime / 1000.0)
+        utime.sleep_ms(delaytime)
 
     def spi_writebyte(self, data):
-        self.spi.write(bytearray(data))
+        # Copy byte values through the scratch buffer instead of allocating
+        scratch = self.scratch
+        n = 0
+        for b in data:
+            scratch[n] = b
+            n += 1
+            if n == Screen.SCRATCH_SIZE:
+                self.spi.write(scratch)
+                n = 0
+        if n:
+            self.spi.write(self.scratch_views[n])
 
     def module_exit(self):
         self.digital_write(self.reset_pin, 0)
 
     # Hardware reset
     def reset(self):
+        mark = self.timing.begin()
         self.digital_write(self.reset_pin, 1)
         self.delay_ms(200) 
         self.digital_write(self.reset_pin, 0)
         self.delay_ms(2)
         self.digital_write(self.reset_pin, 1)
         self.delay_ms(200)   
+        self.timing.end('reset', mark)
 
     def send_command(self, command):
+        self.timing.bytes += 1
+        self.command_buf[0] = command
         self.digital_write(self.dc_pin, 0)
         self.digital_write(self.cs_pin, 0)
-        self.spi_writebyte([command])
+        self.spi.write(self.command_buf)
         self.digital_write(self.cs_pin, 1)
 
     def send_data(self, data):
+        self.timing.bytes += 1
+        self.scratch[0] = data
         self.digital_write(self.dc_pin, 1)
         self.digital_write(self.cs_pin, 0)
-        self.spi_writebyte([data])
+        self.spi.write(self.scratch_views[1])
         self.digital_write(self.cs_pin, 1)
 
-    def WaitUntilIdle(self):
+    def send_command_data(self, command, data=None, start=0, count=None):
+        # Command and payload (data[start:start + count]) in one CS-framed
+        # transaction. The payload is copied through the scratch buffer.
+        self.timing.bytes += 1
+        self.command_buf[0] = command
+        self.digital_write(self.dc_pin, 0)
+        self.digital_write(self.cs_pin, 0)
+        self.spi.write(self.command_buf)
+        if data is not None:
+            if count is None:
+                count = len(data) - start
+            self.timing.bytes += count
+            self.digital_write(self.dc_pin, 1)
+            scratch = self.scratch
+            while count > 0:
+                n = count if count < Screen.SCRATCH_SIZE else Screen.SCRATCH_SIZE
+                for i in range(n):
+                    scratch[i] = data[start + i]
+                self.spi.write(self.scratch_views[n])
+                start += n
+                count -= n
+        self.digital_write(self.cs_pin, 1)
+
+    def send_sequence(self, sequence):
+        # Play a table of (command, length | INIT_WAIT, payload) entries
+        i = 0
+        end = len(sequence)
+        while i < end:
+            command = sequence[i]
+            count = sequence[i + 1] & ~Screen.INIT_WAIT
+            self.send_command_data(command, sequence, i + 2, count)
+            if sequence[i + 1] & Screen.INIT_WAIT:
+                self.delay_ms(100)
+                self.WaitUntilIdle(phase='power on')
+            i += 2 + count
+
+    def send_buffer(self, buffer, length=None):
+        # Stream a run of data bytes: DC/CS are set once and the buffer goes
+        # out in transport.chunk sized writes over a memoryview (no copies)
+        mv = memoryview(buffer)
+        length = len(mv) if length is None else length
+        chunk = self.transport.chunk
+        self.timing.bytes += length
+        self.digital_write(self.dc_pin, 1)
+        self.digital_write(self.cs_pin, 0)
+        for start in range(0, length, chunk):
+            self.spi.write(mv[start:min(start + chunk, length)])
+        self.digital_write(self.cs_pin, 1)
+
+    def send_rows(self, buffer, first_byte, last_byte, first_row, last_row):
+        # Stream bytes first_byte..last_byte - 1 of rows first_row..last_row - 1
+        # of a plane in one transaction
+        line_bytes = self.line_bytes
+        if first_byte == 0 and last_byte == line_bytes:
+            self.send_buffer(memoryview(buffer)[first_row * line_bytes:last_row * line_bytes])
+            return
+        mv = memoryview(buffer)
+        self.timing.bytes += (last_byte - first_byte) * (last_row - first_row)
+        self.digital_write(self.dc_pin, 1)
+        self.digital_write(self.cs_pin, 0)
+        offset = first_row * line_bytes
+        for row in range(first_row, last_row):
+            self.spi.write(mv[offset + first_byte:offset + last_byte])
+            offset += line_bytes
+        self.digital_write(self.cs_pin, 1)
+
+    def send_fill(self, value, count):
+        # Stream count copies of a constant byte, writing the small fill
+        # buffer repeatedly instead of one transaction per byte
+        fill = self.fill_buf
+        if self.fill_value != value:
+            for i in range(len(fill)):
+                fill[i] = value
+            self.fill_value = value
+        size = len(fill)
+        self.timing.bytes += count
+        self.digital_write(self.dc_pin, 1)
+        self.digital_write(self.cs_pin, 0)
+        while count >= size:
+            self.spi.write(fill)
+            count -= size
+        if count:
+            self.spi.write(memoryview(fill)[:count])
+        self.digital_write(self.cs_pin, 1)
+
+    def busy_edge(self, pin):
+        # BUSY rising edge (IRQ): the controller is idle again
+        if self.idle_flag is not None:
+            self.idle_flag.set()
+
+    def busy_fall(self, pin):
+        # BUSY falling edge (IRQ): the controller started working
+        self.busy_seen = True
+
+    def busy_handshake(self, command, timeout_ms=2000):
+        # Send a command that keeps the controller busy for a while (power
+        # off/on) and report whether BUSY dropped and came back, i.e. the
+        # controller understood it
+        self.busy_seen = False
+        self.busy_pin.irq(handler=self.busy_fall, trigger=Pin.IRQ_FALLING)
+        try:
+            self.send_command(command)
+            start = utime.ticks_ms()
+            while not self.busy_seen and self.digital_read(self.busy_pin) != 0:
+                if utime.ticks_diff(utime.ticks_ms(), start) > 50:
+                    return False
+                idle()
+        finally:
+            self.busy_pin.irq(handler=None)
+        try:
+            self.WaitUntilIdle(timeout_ms)
+        except OSError:
+            return False
+        return True
+
+    def WaitUntilIdle(self, timeout_ms=None, phase='busy'):
+        # Sleep until BUSY goes high, waking on interrupts (including the
+        # BUSY edge) instead of polling. Raises OSError after timeout_ms.
+        # The wait is timed as phase, or as 'refresh' from the 0x12 command
+        # when a refresh is pending.
+        if timeout_ms is None:
+            timeout_ms = Screen.BUSY_TIMEOUT_MS
         print("waiting until screen idle... ", end='')
-        while(self.digital_read(self.busy_pin) == 0):   # Wait until the busy_pin goes LOW
-            self.delay_ms(20)
-            print('.', end='')
+        mark = self.timing.begin()
+        start = utime.ticks_ms()
+        self.busy_pin.irq(handler=self.busy_edge, trigger=Pin.IRQ_RISING)
+        try:
+            while(self.digital_read(self.busy_pin) == 0):   # BUSY is LOW while the panel works
+                if utime.ticks_diff(utime.ticks_ms(), start) > timeout_ms:
+                    print("timeout")
+                    raise OSError('Screen busy timeout')
+                idle()
+        finally:
+            self.busy_pin.irq(handler=None)
         self.delay_ms(20) 
-        print("done")  
+        self.end_wait(phase, mark)
+        print("done in {} ms".format(utime.ticks_diff(utime.ticks_ms(), start)))
 
-    def TurnOnDisplay(self):
+    def end_wait(self, phase, mark):
+        if self.refresh_mark is not None:
+            self.timing.end('refresh', self.refresh_mark)
+            self.refresh_mark = None
+        else:
+            self.timing.end(phase, mark)
+
+    async def wait_idle(self, timeout_ms=None, phase='busy'):
+        # Awaitable WaitUntilIdle(): other tasks run until the BUSY edge
+        import uasyncio
+        if timeout_ms is None:
+            timeout_ms = Screen.BUSY_TIMEOUT_MS
+        mark = self.timing.begin()
+        self.idle_flag = uasyncio.ThreadSafeFlag()
+        self.busy_pin.irq(handler=self.busy_edge, trigger=Pin.IRQ_RISING)
+        try:
+            if self.digital_read(self.busy_pin) == 0:
+                await uasyncio.wait_for_ms(self.idle_flag.wait(), timeout_ms)
+        except uasyncio.TimeoutError:
+            raise OSError('Screen busy timeout')
+        finally:
+            self.busy_pin.irq(handler=None)
+            self.idle_flag = None
+        await uasyncio.sleep_ms(20)
+        self.end_wait(phase, mark)
+
+    def TurnOnDisplay(self, wait=True):
+        # wait=False returns as soon as the refresh has started; call
+        # WaitUntilIdle() or await wait_idle() before talking to the panel
+        self.refresh_mark = self.timing.begin()
         self.send_command(0x12) # DISPLAY REFRESH
         self.delay_ms(100)      #!!!The delay here is necessary, 200uS at least!!!
-        self.WaitUntilIdle()
+        if wait:
+            self.WaitUntilIdle()
         
     def init(self):
         # EPD hardware init start     
+        mark = self.timing.begin()
         self.reset()
-        
-        self.send_command(0x06)     # btst
-        self.send_data(0x17)
-        self.send_data(0x17)
-        self.send_data(0x28)        # If an exception is displayed, try using 0x38
-        self.send_data(0x17)
-        
-#         self.send_command(0x01)  # POWER SETTING
-#         self.send_data(0x07)
-#         self.send_data(0x07)     # VGH=20V,VGL=-20V
-#         self.send_data(0x3f)     # VDH=15V
-#         self.send_data(0x3f)     # VDL=-15V
-        
-        self.send_command(0x04)  # POWER ON
-        self.delay_ms(100)
-        self.WaitUntilIdle()
-
-        self.send_command(0X00)   # PANNEL SETTING
-        self.send_data(0x0F)      # KW-3f   KWR-2F	BWROTP 0f	BWOTP 1f
-
-        self.send_command(0x61)     # tres
-        self.send_data(0x03)     # source 800
-        self.send_data(0x20)
-        self.send_data(0x01)     # gate 480
-        self.send_data(0xE0)
-
-        self.send_command(0X15)
-        self.send_data(0x00)
-
-        self.send_command(0X50)     # VCOM AND DATA INTERVAL SETTING
-        self.send_data(0x11)
-        self.send_data(0x07)
-
-        self.send_command(0X60)     # TCON SETTING
-        self.send_data(0x22)
-
-        self.send_command(0x65)     # Resolution setting
-        self.send_data(0x00)
-        self.send_data(0x00)     # 800*480
-        self.send_data(0x00)
-        self.send_data(0x00)
-        
+        self.send_sequence(Screen.INIT_SEQUENCE)
+        self.timing.end('init', mark)
         return 0;
 
     def Clear(self):
-        
-        high = self.height
-        if( self.width % 8 == 0) :
-            wide =  self.width // 8
-        else :
-            wide =  self.width // 8 + 1
-        
-        self.send_command(0x10) 
-        for j in range(0, high):
-            for i in range(0, wide):
-                self.send_data(0xff)
-                
-        self.send_command(0x13) 
-        for j in range(0, high):
-            for i in range(0, wide):
-                self.send_data(0x00)
-                
-        self.TurnOnDisplay()
+        self.clear_planes(0xff, 0x00)
         
     def ClearRed(self):
-        
-        high = self.height
-        if( self.width % 8 == 0) :
-            wide =  self.width // 8
-        else :
-            wide =  self.width // 8 + 1
-        
-        self.send_command(0x10) 
-        for j in range(0, high):
-            for i in range(0, wide):
-                self.send_data(0xff)
-                
-        self.send_command(0x13) 
-        for j in range(0, high):
-            for i in range(0, wide):
-                self.send_data(0xff)
-                
-        self.TurnOnDisplay()
+        self.clear_planes(0xff, 0xff)
         
     def ClearBlack(self):
+        self.clear_planes(0x00, 0x00)
         
-        high = self.height
-        if( self.width % 8 == 0) :
-            wide =  self.width // 8
-        else :
-            wide =  self.width // 8 + 1
+    def clear_planes(self, black, red):
+        # Fill both planes with constant bytes and refresh
+        if self.frame_store is not None:
+            self.frame_store.invalidate()
         
+        mark = self.timing.begin()
         self.send_command(0x10) 
-        for j in range(0, high):
-            for i in range(0, wide):
-                self.send_data(0x00)
+        self.send_fill(black, self.plane_bytes)
                 
         self.send_command(0x13) 
-        for j in range(0, high):
-            for i in range(0, wide):
-                self.send_data(0x00)
+        self.send_fill(red, self.plane_bytes)
+        self.timing.end('clear', mark)
                 
         self.TurnOnDisplay()
         
-    def display(self):
+    def display(self, pre_clear=False, wait=True):
+        # pre_clear: run a full clear refresh first. The frame is written
+        # directly over the previous one otherwise. wait: see TurnOnDisplay().
+        if self.band_rows:
+            raise ValueError('Banded Screen, use render_bands()')
+        self.changed = None
+        if self.frame_store is not None:
+            self.changed = self.frame_store.changes(self.buffer_black, self.buffer_red)
+            if self.changed is not None and len(self.changed) == 0 and not pre_clear:
+                print('Frame unchanged, refresh skipped')
+                self.transfer_ms = 0
+                return 0
         
-        high = self.height
-        if( self.width % 8 == 0) :
-            wide =  self.width // 8
-        else :
-            wide =  self.width // 8 + 1
+        if pre_clear:
+            self.Clear()
+        
+        start = utime.ticks_ms()
         
         # send black data
+        mark = self.timing.begin()
         self.send_command(0x10) 
-        for j in range(0, high):
-            for i in range(0, wide):
-                self.send_data(self.buffer_black[i + j * wide])
+        self.send_buffer(self.buffer_black, self.plane_bytes)
+        self.timing.end('black', mark)
             
         # send red data
+        mark = self.timing.begin()
         self.send_command(0x13) 
-        for j in range(0, high):
-            for i in range(0, wide):
-                self.send_data(self.buffer_red[i + j * wide])
+        self.send_buffer(self.buffer_red, self.plane_bytes)
+        self.timing.end('red', mark)
+        
+        self.transfer_ms = utime.ticks_diff(utime.ticks_ms(), start)
                 
-        self.TurnOnDisplay()
+        self.TurnOnDisplay(wait=False)
+        
+        # Store the frame while the panel refreshes
+        if self.frame_store is not None:
+            self.frame_store.save(self.buffer_black, self.buffer_red)
+        
+        if wait:
+            self.WaitUntilIdle()
+        
+        return self.transfer_ms
+
+
+    def render_bands(self, draw, pre_clear=False, wait=True):
+        # Banded display(): draw() renders the whole frame through the text
+        # methods and images, and is called once per band and plane. Each
+        # band is streamed as soon as it is rasterized. The controller takes
+        # plane data sequentially after 0x10/0x13, so the black plane goes
+        # out in a first pass over the bands and the red plane in a second.
+        # Drawing for the other plane or outside the band is skipped.
+        if pre_clear:
+            self.Clear()
+        
+        # Bands are never held as a whole frame to compare or save, so the
+        # stored frame stops describing the glass
+        if self.frame_store is not None:
+            self.frame_store.invalidate()
+        
+        self.changed = None
+        start = utime.ticks_ms()
+        
+        # The plane phases include rasterizing the bands
+        for command, image, buffer, phase in ((0x10, self.imageblack, self.buffer_black, 'black'),
+                                              (0x13, self.imagered, self.buffer_red, 'red')):
+            mark = self.timing.begin()
+            self.send_command(command)
+            self.band_image = image
+            top = 0
+            try:
+                while top < self.height:
+                    rows = min(self.band_rows, self.height - top)
+                    self.imageblack.top = self.imagered.top = top
+                    self.imageblack.fill(0xff)
+                    self.imagered.fill(0x00)
+                    self.text_row = 1
+                    draw()
+                    self.send_buffer(buffer, rows * self.line_bytes)
+                    top += rows
+            finally:
+                self.band_image = None
+            self.timing.end(phase, mark)
+        
+        self.transfer_ms = utime.ticks_diff(utime.ticks_ms(), start)
+        
+        self.TurnOnDisplay(wait=wait)
+        
+        return self.transfer_ms
 
+    def display_window(self, x, y, w, h):
+        # Refresh only the rectangle (x, y, w, h) from buffer_black/buffer_red
+        # using the partial window commands. The window is clipped to the
+        # screen and widened to whole bytes horizontally.
+        if self.band_rows:
+            raise ValueError('Banded Screen, use render_bands()')
+        x0 = max(x, 0) & ~7
+        x1 = (min(x + w, self.width) + 7) & ~7
+        y0 = max(y, 0)
+        y1 = min(y + h, self.height)
+        if x1 <= x0 or y1 <= y0:
+            return 0
+        
+        # The planes outside the window may differ from the glass now, so
+        # the stored frame no longer describes it
+        if self.frame_store is not None:
+            self.frame_store.invalidate()
+        
+        window = self.window_buf
+        window[0] = x0 >> 8              # HRST, low 3 bits ignored
+        window[1] = x0 & 0xf8
+        window[2] = (x1 - 1) >> 8        # HRED
+        window[3] = (x1 - 1) & 0xff
+        window[4] = y0 >> 8              # VRST
+        window[5] = y0 & 0xff
+        window[6] = (y1 - 1) >> 8        # VRED
+        window[7] = (y1 - 1) & 0xff
+        window[8] = 0x01                 # PT_SCAN: gates scan inside and outside
+        
+        self.send_command(0x91)          # PARTIAL IN
+        self.send_command_data(0x90, window)  # PARTIAL WINDOW
+        
+        start = utime.ticks_ms()
+        
+        mark = self.timing.begin()
+        self.send_command(0x10)
+        self.send_rows(self.buffer_black, x0 // 8, x1 // 8, y0, y1)
+        self.timing.end('black', mark)
+        
+        mark = self.timing.begin()
+        self.send_command(0x13)
+        self.send_rows(self.buffer_red, x0 // 8, x1 // 8, y0, y1)
+        self.timing.end('red', mark)
+        
+        self.transfer_ms = utime.ticks_diff(utime.ticks_ms(), start)
+        
+        self.TurnOnDisplay()
+        self.send_command(0x92)          # PARTIAL OUT
+        
+        return self.transfer_ms
 
     def sleep(self):
+        mark = self.timing.begin()
         self.send_command(0x02) # power off
-        self.WaitUntilIdle()
-        self.send_command(0x07) # deep sleep
-        self.send_data(0xa5)
+        self.WaitUntilIdle(phase='power off')
+        self.send_command_data(0x07, b'\xa5') # deep sleep
+        self.timing.end('sleep', mark)
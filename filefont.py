@@ -0,0 +1,214 @@
+# File-backed fonts
+#
+# A FileFont has the same functions as a font-to-py module (height(),
+# get_ch(), ...) so Writer takes it as is, but its glyphs stay in a binary
+# file on flash. get_ch() reads a glyph with seek()/readinto() and keeps the
+# most recently used ones in a small LRU, so the heap a font costs does not
+# grow with its size.
+#
+# File: MAGIC, height, max_width, flags (bit 0 hmap, 1 reverse, 2
+# monospaced, 3 run-length glyphs, see fontgen.py), min_ch, max_ch, the
+# length of the source fingerprint (u8 each) and the fingerprint, then per
+# glyph slot (slot 0 is the default glyph, slot n is chr(min_ch + n - 1))
+# the advance widths (u8), the true widths (u8) and the glyph offsets (u32,
+# plus one for the end), then the glyph bitmaps.
+
+from array import array
+from collections import OrderedDict
+import gc
+import sys
+
+MAGIC = b'FF2'
+HEADER_SIZE = 9
+
+
+class FileFont:
+    LRU_SIZE = 32
+
+    def __init__(self, path, lru_size=LRU_SIZE):
+        self.path = path
+        self.lru_size = lru_size
+        self.glyphs = OrderedDict()     # slot -> glyph bytes, least recent first
+        f = open(path, 'rb')
+        try:
+            header = f.read(HEADER_SIZE)
+            if header[:3] != MAGIC:
+                raise ValueError('Not a font file')
+            self._height = header[3]
+            self._max_width = header[4]
+            self._flags = header[5]
+            self._min_ch = header[6]
+            self._max_ch = header[7]
+            self.fingerprint = f.read(header[8])
+            slots = self._max_ch - self._min_ch + 2
+            self._widths = array('B', f.read(slots))
+            self._true_widths = array('B', f.read(slots))
+            self.offsets = array('I', f.read(4 * (slots + 1)))
+        except Exception:
+            f.close()
+            raise
+        self.file = f
+
+    def close(self):
+        self.file.close()
+        self.glyphs = OrderedDict()
+
+    def height(self):
+        return self._height
+
+    def max_width(self):
+        return self._max_width
+
+    def hmap(self):
+        return self._flags & 1 != 0
+
+    def reverse(self):
+        return self._flags & 2 != 0
+
+    def monospaced(self):
+        return self._flags & 4 != 0
+
+    def rle(self):
+        return self._flags & 8 != 0
+
+    def min_ch(self):
+        return self._min_ch
+
+    def max_ch(self):
+        return self._max_ch
+
+    def widths(self):
+        return self._widths
+
+    def true_widths(self):
+        return self._true_widths
+
+    def get_ch(self, ch):
+        o = ord(ch)
+        slot = o - self._min_ch + 1 if self._min_ch <= o <= self._max_ch else 0
+        glyphs = self.glyphs
+        glyph = glyphs.pop(slot, None)
+        if glyph is None:
+            start = self.offsets[slot]
+            glyph = bytearray(self.offsets[slot + 1] - start)
+            self.file.seek(start)
+            self.file.readinto(glyph)
+            if len(glyphs) >= self.lru_size:
+                glyphs.pop(next(iter(glyphs)))
+        glyphs[slot] = glyph    # Most recently used
+        return memoryview(glyph), self._height, self._widths[slot]
+
+    @staticmethod
+    def build(path, font, fingerprint=b''):
+        # Write the font-to-py module (or FileFont) font to path, recording
+        # the fingerprint of its source (see load_font())
+        from writer import Writer
+        widths, true_widths = Writer._widths(font)
+        chars = [chr(0)] + [chr(c) for c in range(font.min_ch(), font.max_ch() + 1)]
+        flags = (1 if font.hmap() else 0) | (2 if font.reverse() else 0) | (4 if font.monospaced() else 0)
+        if hasattr(font, 'rle') and font.rle():
+            flags |= 8
+        offsets = array('I')
+        offset = HEADER_SIZE + len(fingerprint) + 2 * len(chars) + 4 * (len(chars) + 1)
+        for c in chars:
+            offsets.append(offset)
+            offset += len(font.get_ch(c)[0])
+        offsets.append(offset)
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(bytes((font.height(), font.max_width(), flags, font.min_ch(), font.max_ch(), len(fingerprint))))
+            f.write(fingerprint)
+            f.write(widths)
+            f.write(true_widths)
+            f.write(offsets)
+            for c in chars:
+                f.write(font.get_ch(c)[0])
+        Writer.width_tables.pop(font, None)
+
+
+_fonts = {}     # name -> FileFont, shared so Writer caches key on one object
+_fingerprints = {}  # name -> source fingerprint, looked up once per boot
+_info = {}      # name -> (height, max_width, fingerprint), see font_info()
+
+
+def fingerprint(name):
+    # Identifies the current source of font module name: size and mtime of
+    # its file, or for a frozen module its version and glyph data length.
+    # None if the module is gone (only its .fnt was kept).
+    if name in _fingerprints:
+        return _fingerprints[name]
+    result = _source_fingerprint(name)
+    _fingerprints[name] = result
+    return result
+
+
+def _source_fingerprint(name):
+    import os
+    for folder in sys.path:
+        for ext in ('.py', '.mpy'):
+            try:
+                st = os.stat((folder + '/' if folder else '') + name + ext)
+            except OSError:
+                continue
+            return '{}:{}:{}'.format(ext, st[6], st[8]).encode()
+    try:
+        module = __import__(name)
+    except ImportError:
+        return None
+    result = 'frozen:{}:{}'.format(getattr(module, 'version', ''), len(getattr(module, '_font', b''))).encode()
+    del module
+    sys.modules.pop(name, None)
+    return result
+
+
+def load_font(name):
+    # The FileFont name.fnt, built from the font module name on first use
+    # and rebuilt when the module changed since
+    font = _fonts.get(name)
+    if font is not None:
+        return font
+    path = name + '.fnt'
+    source = fingerprint(name)
+    try:
+        font = FileFont(path)
+        if source is not None and font.fingerprint != source:
+            font.close()
+            font = None
+    except (OSError, ValueError, IndexError):
+        font = None
+    if font is None:
+        module = __import__(name)
+        FileFont.build(path, module, source or b'')
+        # Drop the module so its glyph tables can be collected
+        del module
+        sys.modules.pop(name, None)
+        gc.collect()
+        font = FileFont(path)
+    _fonts[name] = font
+    return font
+
+
+def font_info(name):
+    # (height, max_width, fingerprint) of font name. Taken from the header
+    # of name.fnt when that is current, so nothing is kept open and no
+    # glyph tables are read; otherwise the font is loaded (and rebuilt).
+    info = _info.get(name)
+    if info is not None:
+        return info
+    font = _fonts.get(name)
+    if font is None:
+        source = fingerprint(name)
+        try:
+            with open(name + '.fnt', 'rb') as f:
+                header = f.read(HEADER_SIZE)
+                if header[:3] == MAGIC:
+                    stored = f.read(header[8])
+                    if source is None or stored == source:
+                        info = (header[3], header[4], stored)
+        except (OSError, IndexError):
+            pass
+    if info is None:
+        font = font or load_font(name)
+        info = (font.height(), font.max_width(), font.fingerprint)
+    _info[name] = info
+    return info
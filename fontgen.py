@@ -0,0 +1,153 @@
+# Font module generator
+#
+# Writes a font (a font-to-py module, a module written by this generator or
+# a filefont.FileFont) as a Python module whose get_ch() is allocation free
+# apart from the returned memoryview: the glyph bitmaps are packed without
+# width prefixes and located through an array('H') of offsets, next to the
+# advance and true width tables Writer measures text with.
+#
+# With rle=True the glyphs are run-length encoded instead (see rle_encode())
+# and the module's rle() returns True; Writer then draws them with
+# fill_rect() calls, without a glyph buffer. Worth it for large fonts, where
+# most of each glyph box is blank.
+#
+# On the host, from the repository root:
+#     python fontgen.py [--rle] freesans20 [freesans20.py]
+# regenerates freesans20.py in place (or writes the named file).
+
+from array import array
+
+BYTES_PER_LINE = 16
+
+
+def _bytes_literal(name, data, typecode=None):
+    # name = b'...' (or array(typecode, b'...')) in font-to-py's layout
+    lines = []
+    for i in range(0, len(data), BYTES_PER_LINE):
+        lines.append("b'" + ''.join('\\x{:02x}'.format(b) for b in data[i:i + BYTES_PER_LINE]) + "'")
+    if not lines:
+        lines.append("b''")
+    if typecode is None:
+        return '{} =\\\n{}\n'.format(name, '\\\n'.join(lines))
+    return "{} = array('{}',\n    {})\n".format(name, typecode, '\n    '.join(lines))
+
+
+def rle_encode(glyph, height, width, reverse=False):
+    # Bands of identical rows, each: row count, run count, then (start,
+    # length) of every run of lit pixels. Blank bands have no runs.
+    stride = (width + 7) // 8
+    rows = []
+    for row in range(height):
+        runs = []
+        start = None
+        for col in range(width + 1):
+            lit = False
+            if col < width:
+                data = glyph[row * stride + col // 8]
+                lit = data & (1 << (col & 7) if reverse else 0x80 >> (col & 7)) != 0
+            if lit and start is None:
+                start = col
+            elif not lit and start is not None:
+                runs.append((start, col - start))
+                start = None
+        rows.append(runs)
+    encoded = bytearray()
+    row = 0
+    while row < height:
+        count = 1
+        while row + count < height and rows[row + count] == rows[row] and count < 255:
+            count += 1
+        encoded.append(count)
+        encoded.append(len(rows[row]))
+        for start, length in rows[row]:
+            encoded.append(start)
+            encoded.append(length)
+        row += count
+    return encoded
+
+
+def _tables(font):
+    if hasattr(font, 'true_widths'):
+        return font.widths(), font.true_widths()
+    from writer import Writer
+    return Writer._widths(font)
+
+
+def generate(font, path, font_name='', version='0.25', rle=False):
+    if hasattr(font, 'rle') and font.rle():
+        raise ValueError('Regenerate from a bitmap font')
+    if rle and font.max_width() > 255:
+        raise ValueError('Font too wide for run-length glyphs')
+    min_ch = font.min_ch()
+    max_ch = font.max_ch()
+    chars = [chr(0)] + [chr(c) for c in range(min_ch, max_ch + 1)]
+    glyphs = bytearray()
+    offsets = array('H', [0])
+    for c in chars:
+        glyph, height, width = font.get_ch(c)
+        if rle:
+            glyph = rle_encode(glyph, height, width, font.reverse())
+        glyphs.extend(glyph)
+        if len(glyphs) > 0xffff:
+            raise ValueError('Font too large for 16 bit offsets')
+        offsets.append(len(glyphs))
+    widths, true_widths = _tables(font)
+    offset_bytes = bytearray()
+    for offset in offsets:
+        offset_bytes.append(offset & 0xff)
+        offset_bytes.append(offset >> 8)
+
+    with open(path, 'w') as f:
+        f.write('# Code generated by fontgen.py from font-to-py output.\n')
+        f.write('# Font: {}\n'.format(font_name))
+        f.write("version = '{}'\n\n".format(version))
+        f.write('from array import array\n')
+        for func, value in (('height', font.height()), ('max_width', font.max_width()),
+                            ('hmap', font.hmap()), ('reverse', font.reverse()),
+                            ('monospaced', font.monospaced()),
+                            ('min_ch', min_ch), ('max_ch', max_ch), ('rle', rle)):
+            f.write('\ndef {}():\n    return {}\n'.format(func, value))
+        f.write('\n# Glyph {} of each slot: slot 0 is the default glyph, slot n is\n'.format('runs' if rle else 'bitmaps'))
+        f.write('# chr(min_ch() + n - 1). Slot n spans _font[_offsets[n]:_offsets[n + 1]].\n')
+        f.write(_bytes_literal('_font', glyphs))
+        f.write('\n')
+        f.write(_bytes_literal('_offsets', offset_bytes, 'H'))
+        f.write('\n_mvfont = memoryview(_font)\n')
+        f.write('\n# Advance and printable width (trailing blank columns dropped) of each slot\n')
+        f.write(_bytes_literal('_widths', widths, 'B'))
+        f.write(_bytes_literal('_true_widths', true_widths, 'B'))
+        f.write('\ndef widths():\n    return _widths\n')
+        f.write('\ndef true_widths():\n    return _true_widths\n')
+        f.write('\ndef get_ch(ch):\n')
+        f.write('    ordch = ord(ch)\n')
+        f.write('    slot = ordch - {} if {} <= ordch <= {} else 0\n'.format(min_ch - 1, min_ch, max_ch))
+        f.write('    return _mvfont[_offsets[slot]:_offsets[slot + 1]], {}, _widths[slot]\n'.format(font.height()))
+
+
+def _source_info(name):
+    # Font name and version recorded in an existing module's source
+    font_name = ''
+    version = '0.25'
+    try:
+        with open(name + '.py') as f:
+            for line in f:
+                if line.startswith('# Font:'):
+                    font_name = line[7:].strip()
+                elif line.startswith('version ='):
+                    version = line.split("'")[1]
+                    break
+    except OSError:
+        pass
+    return font_name, version
+
+
+if __name__ == '__main__':
+    import sys
+    args = sys.argv[1:]
+    rle = '--rle' in args
+    if rle:
+        args.remove('--rle')
+    name = args[0]
+    path = args[1] if len(args) > 1 else name + '.py'
+    font_name, version = _source_info(name)
+    generate(__import__(name), path, font_name, version, rle)
@@ -0,0 +1,162 @@
+# Last displayed frame kept on flash
+#
+# Both planes are stored row by row, each row PackBits-style run-length
+# encoded (a blank row takes 3 bytes). Before a refresh the new planes are
+# compared (XOR) against the stored copy to find the changed regions; an
+# unchanged frame can skip the transfer and the panel refresh entirely.
+#
+# File layout: b'FS', line bytes, rows, then for each plane and row one
+# length byte followed by that many encoded bytes. Encoded rows are control
+# byte c and data: c < 0x80 is a literal of c + 1 bytes, c >= 0x80 a run of
+# (c & 0x7f) + 1 copies of the next byte.
+
+
+class FrameStore:
+    MAGIC = b'FS'
+
+    def __init__(self, path='last_frame.bin', line_bytes=100, rows=480):
+        if line_bytes > 250:
+            raise ValueError('Rows too wide for the frame store')
+        self.path = path
+        self.line_bytes = line_bytes
+        self.rows = rows
+        self.row = bytearray(line_bytes)            # Decoded stored row
+        self.encoded = bytearray(line_bytes + 8)    # One encoded row
+        self.encoded_mv = memoryview(self.encoded)
+        self.length_buf = bytearray(1)
+
+    def _header(self):
+        return self.MAGIC + bytes((self.line_bytes, 0, self.rows & 0xff, self.rows >> 8))
+
+    def _encode(self, row):
+        # PackBits-style encode row into self.encoded, return the length
+        out = self.encoded
+        n = len(row)
+        i = 0
+        o = 0
+        while i < n:
+            v = row[i]
+            j = i + 1
+            while j < n and row[j] == v and j - i < 128:
+                j += 1
+            if j - i > 2 or j == n:
+                out[o] = 0x80 | (j - i - 1)
+                out[o + 1] = v
+                o += 2
+                i = j
+                continue
+            # Literal: up to the next run of three
+            start = i
+            while i < n and i - start < 128:
+                if i + 2 < n and row[i] == row[i + 1] == row[i + 2]:
+                    break
+                i += 1
+            out[o] = i - start - 1
+            o += 1
+            for k in range(start, i):
+                out[o] = row[k]
+                o += 1
+        return o
+
+    def _decode(self, length):
+        # Decode self.encoded[:length] into self.row
+        src = self.encoded
+        row = self.row
+        i = 0
+        o = 0
+        lb = self.line_bytes
+        while i < length:
+            c = src[i]
+            if c & 0x80:
+                n = (c & 0x7f) + 1
+                if o + n > lb or i + 2 > length:
+                    raise ValueError('Corrupt frame store row')
+                v = src[i + 1]
+                for k in range(o, o + n):
+                    row[k] = v
+                o += n
+                i += 2
+            else:
+                n = c + 1
+                if o + n > lb or i + 1 + n > length:
+                    raise ValueError('Corrupt frame store row')
+                for k in range(n):
+                    row[o + k] = src[i + 1 + k]
+                o += n
+                i += n + 1
+        if o != lb:
+            raise ValueError('Corrupt frame store row')
+
+    def save(self, black, red):
+        lb = self.line_bytes
+        with open(self.path, 'wb') as f:
+            f.write(self._header())
+            for plane in (black, red):
+                mv = memoryview(plane)
+                for y in range(self.rows):
+                    length = self._encode(mv[y * lb:(y + 1) * lb])
+                    self.length_buf[0] = length
+                    f.write(self.length_buf)
+                    f.write(self.encoded_mv[:length])
+
+    def invalidate(self):
+        try:
+            import os
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def changes(self, black, red):
+        # Compare the planes with the stored frame. Returns a list of
+        # changed (x, y, w, h) boxes, empty when the frame is unchanged,
+        # or None when there is no usable stored frame.
+        lb = self.line_bytes
+        first = bytearray(b'\xff' * self.rows)   # Leftmost changed byte per row, 0xff: none
+        last = bytearray(self.rows)              # Rightmost changed byte per row
+        length_buf = self.length_buf
+        try:
+            with open(self.path, 'rb') as f:
+                if f.read(6) != self._header():
+                    return None
+                for plane in (black, red):
+                    mv = memoryview(plane)
+                    for y in range(self.rows):
+                        if f.readinto(length_buf) != 1:
+                            return None
+                        length = length_buf[0]
+                        if f.readinto(self.encoded_mv[:length]) != length:
+                            return None
+                        self._decode(length)
+                        offset = y * lb
+                        if self.row == mv[offset:offset + lb]:
+                            continue
+                        row = self.row
+                        lo = 0
+                        while row[lo] ^ plane[offset + lo] == 0:
+                            lo += 1
+                        hi = lb - 1
+                        while row[hi] ^ plane[offset + hi] == 0:
+                            hi -= 1
+                        if lo < first[y]:
+                            first[y] = lo
+                        if hi > last[y]:
+                            last[y] = hi
+        except (OSError, ValueError):
+            return None
+
+        # Merge runs of changed rows into bounding boxes
+        boxes = []
+        y = 0
+        while y < self.rows:
+            if first[y] == 0xff:
+                y += 1
+                continue
+            top = y
+            lo = first[y]
+            hi = last[y]
+            while y < self.rows and first[y] != 0xff:
+                lo = min(lo, first[y])
+                hi = max(hi, last[y])
+                y += 1
+            boxes.append((lo * 8, top, (hi - lo + 1) * 8, y - top))
+        return boxes
@@ -1,7 +1,9 @@
-# Code generated by font-to-py.py.
+# Code generated by fontgen.py from font-to-py output.
 # Font: FreeSans.ttf
 version = '0.25'
 
+from array import array
+
 def height():
     return 20
 
@@ -23,266 +25,265 @@ def min_ch():
 def max_ch():
     return 126
 
+def rle():
+    return False
+
+# Glyph bitmaps of each slot: slot 0 is the default glyph, slot n is
+# chr(min_ch() + n - 1). Slot n spans _font[_offsets[n]:_offsets[n + 1]].
 _font =\
-b'\x0b\x00\x00\x00\x3c\x00\x7e\x00\xc7\x00\xc3\x00\x03\x00\x03\x00'\
-b'\x06\x00\x0c\x00\x08\x00\x18\x00\x18\x00\x00\x00\x00\x00\x18\x00'\
-b'\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00'\
+b'\x00\x00\x3c\x00\x7e\x00\xc7\x00\xc3\x00\x03\x00\x03\x00\x06\x00'\
+b'\x0c\x00\x08\x00\x18\x00\x18\x00\x00\x00\x00\x00\x18\x00\x18\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x07\x00\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x00\x00'\
-b'\xc0\xc0\x00\x00\x00\x00\x07\x00\x00\x00\xd8\xd8\xd8\xd8\x90\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00'\
-b'\x00\x00\x0c\xc0\x08\x80\x08\x80\x7f\xe0\x7f\xe0\x19\x80\x11\x00'\
-b'\x11\x00\xff\xc0\xff\xc0\x33\x00\x33\x00\x22\x00\x22\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0b\x00\x08\x00\x3e\x00\x7f\x80\xe9\xc0'\
-b'\xc8\xc0\xc8\xc0\xc8\x00\xe8\x00\x7c\x00\x1f\x80\x09\xc0\x08\xc0'\
-b'\xc8\xc0\xe9\xc0\x7f\x80\x3e\x00\x08\x00\x00\x00\x00\x00\x00\x00'\
-b'\x12\x00\x00\x00\x00\x00\x00\x00\x38\x10\x00\x7c\x10\x00\xc6\x20'\
-b'\x00\xc6\x20\x00\xc6\x40\x00\x7c\xc0\x00\x38\x80\x00\x01\x1e\x00'\
-b'\x01\x3f\x00\x02\x73\x80\x02\x61\x80\x04\x73\x80\x04\x3f\x00\x08'\
-b'\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0d\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0'\
+b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x00\x00\xc0\xc0\x00\x00\x00\x00'\
+b'\x00\x00\xd8\xd8\xd8\xd8\x90\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x0c\xc0\x08\x80\x08\x80\x7f\xe0'\
+b'\x7f\xe0\x19\x80\x11\x00\x11\x00\xff\xc0\xff\xc0\x33\x00\x33\x00'\
+b'\x22\x00\x22\x00\x00\x00\x00\x00\x00\x00\x00\x00\x08\x00\x3e\x00'\
+b'\x7f\x80\xe9\xc0\xc8\xc0\xc8\xc0\xc8\x00\xe8\x00\x7c\x00\x1f\x80'\
+b'\x09\xc0\x08\xc0\xc8\xc0\xe9\xc0\x7f\x80\x3e\x00\x08\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x38\x10\x00\x7c\x10\x00'\
+b'\xc6\x20\x00\xc6\x20\x00\xc6\x40\x00\x7c\xc0\x00\x38\x80\x00\x01'\
+b'\x1e\x00\x01\x3f\x00\x02\x73\x80\x02\x61\x80\x04\x73\x80\x04\x3f'\
+b'\x00\x08\x1e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x0e\x00\x1f\x00\x31\x80\x31\x80\x31\x80\x1f\x00'\
 b'\x1c\x00\x76\x60\xe3\x60\xc1\xc0\xc0\xc0\xe1\xc0\x7f\x60\x3e\x30'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\xc0\xc0\xc0\xc0'\
-b'\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00'\
-b'\x00\x10\x10\x20\x20\x60\x40\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x40\x60'\
-b'\x20\x30\x10\x18\x07\x00\x00\x40\x40\x20\x20\x30\x10\x18\x18\x18'\
-b'\x18\x18\x18\x18\x10\x30\x20\x60\x40\xc0\x08\x00\x00\x20\x20\xf8'\
-b'\x20\x50\x50\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x18\x00\x18\x00\x18\x00\xff\x00\xff\x00\x18\x00\x18\x00\x18\x00'\
-b'\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\x40\x40\x80\x00'\
-b'\x07\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\xf8\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\xc0\xc0\x00\x00\x00\x00\x06\x00\x00\x04'\
-b'\x0c\x08\x08\x18\x10\x10\x30\x20\x20\x60\x40\x40\xc0\x80\x00\x00'\
-b'\x00\x00\x0b\x00\x00\x00\x00\x00\x3e\x00\x7f\x00\x63\x00\xe3\x80'\
-b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xe3\x80\x63\x00'\
-b'\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00'\
-b'\x00\x00\x10\x00\x30\x00\xf0\x00\xf0\x00\x30\x00\x30\x00\x30\x00'\
-b'\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x3e\x00\x7f\x00'\
-b'\xe3\x80\xc1\x80\x01\x80\x01\x80\x03\x00\x0e\x00\x1c\x00\x30\x00'\
-b'\x60\x00\xc0\x00\xff\x80\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0b\x00\x00\x00\x00\x00\x3e\x00\x7f\x00\xe3\x80\xc1\x80\x01\x80'\
-b'\x0f\x00\x0f\x00\x03\x80\x01\x80\x01\x80\xc1\x80\xe3\x80\x7f\x00'\
-b'\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00'\
-b'\x06\x00\x06\x00\x0e\x00\x1e\x00\x16\x00\x26\x00\x46\x00\x46\x00'\
-b'\x86\x00\xff\x00\xff\x00\x06\x00\x06\x00\x06\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x7f\x00\x7f\x00\x60\x00'\
-b'\x60\x00\xde\x00\xff\x00\xe3\x80\x01\x80\x01\x80\x01\x80\x01\x80'\
-b'\xc3\x00\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0\xc0\x80\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x10\x20'\
+b'\x20\x60\x40\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x40\x60\x20\x30\x10\x18'\
+b'\x00\x40\x40\x20\x20\x30\x10\x18\x18\x18\x18\x18\x18\x18\x10\x30'\
+b'\x20\x60\x40\xc0\x00\x20\x20\xf8\x20\x50\x50\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x18\x00\x18\x00\x18\x00\xff\x00\xff\x00'\
+b'\x18\x00\x18\x00\x18\x00\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0'\
+b'\x40\x40\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xf8\xf8\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\xc0\xc0\x00\x00\x00\x00\x00\x04\x0c\x08'\
+b'\x08\x18\x10\x10\x30\x20\x20\x60\x40\x40\xc0\x80\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x3e\x00\x7f\x00\x63\x00\xe3\x80\xc1\x80\xc1\x80'\
+b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xe3\x80\x63\x00\x7f\x00\x3e\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x30\x00'\
+b'\xf0\x00\xf0\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00\x30\x00'\
+b'\x30\x00\x30\x00\x30\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x3e\x00\x7f\x00\xe3\x80\xc1\x80\x01\x80\x01\x80'\
+b'\x03\x00\x0e\x00\x1c\x00\x30\x00\x60\x00\xc0\x00\xff\x80\xff\x80'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3e\x00\x7f\x00'\
+b'\xe3\x80\xc1\x80\x01\x80\x0f\x00\x0f\x00\x03\x80\x01\x80\x01\x80'\
+b'\xc1\x80\xe3\x80\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x06\x00\x06\x00\x0e\x00\x1e\x00\x16\x00\x26\x00'\
+b'\x46\x00\x46\x00\x86\x00\xff\x00\xff\x00\x06\x00\x06\x00\x06\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x7f\x00\x7f\x00'\
+b'\x60\x00\x60\x00\xde\x00\xff\x00\xe3\x80\x01\x80\x01\x80\x01\x80'\
+b'\x01\x80\xc3\x00\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x1e\x00\x3f\x00\x63\x00\x61\x80\xc0\x00\xde\x00'\
 b'\xff\x00\xe3\x80\xc1\x80\xc1\x80\xc1\x80\x63\x80\x7f\x00\x3e\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\xff\x80'\
-b'\xff\x80\x01\x00\x03\x00\x02\x00\x06\x00\x04\x00\x0c\x00\x08\x00'\
-b'\x18\x00\x18\x00\x10\x00\x30\x00\x30\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0b\x00\x00\x00\x00\x00\x1c\x00\x3e\x00\x63\x00\x63\x00'\
-b'\x63\x00\x3e\x00\x3e\x00\x63\x00\xc1\x80\xc1\x80\xc1\x80\x63\x00'\
-b'\x7f\x00\x1c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00'\
-b'\x00\x00\x3e\x00\x7f\x00\xe3\x00\xc1\x80\xc1\x80\xc1\x80\xe3\x80'\
-b'\x7f\x80\x3d\x80\x01\x80\x03\x00\xe3\x00\x7e\x00\x3c\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x05\x00\x00\x00\x00\x00\x00\xc0\xc0\x00'\
-b'\x00\x00\x00\x00\x00\x00\xc0\xc0\x00\x00\x00\x00\x05\x00\x00\x00'\
-b'\x00\x00\x00\x00\xc0\xc0\x00\x00\x00\x00\x00\x00\xc0\xc0\x40\x40'\
-b'\x80\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x40\x01\xc0\x07\x00\x3c\x00\xe0\x00\xe0\x00\x78\x00\x0f\x00'\
-b'\x03\xc0\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xc0'\
-b'\xff\xc0\x00\x00\x00\x00\xff\xc0\xff\xc0\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x80\xff\x80'\
+b'\x01\x00\x03\x00\x02\x00\x06\x00\x04\x00\x0c\x00\x08\x00\x18\x00'\
+b'\x18\x00\x10\x00\x30\x00\x30\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x1c\x00\x3e\x00\x63\x00\x63\x00\x63\x00\x3e\x00'\
+b'\x3e\x00\x63\x00\xc1\x80\xc1\x80\xc1\x80\x63\x00\x7f\x00\x1c\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3e\x00\x7f\x00'\
+b'\xe3\x00\xc1\x80\xc1\x80\xc1\x80\xe3\x80\x7f\x80\x3d\x80\x01\x80'\
+b'\x03\x00\xe3\x00\x7e\x00\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\xc0\xc0\x00\x00\x00\x00\x00\x00\x00\xc0\xc0'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\x00\x00\x00\x00'\
+b'\x00\x00\xc0\xc0\x40\x40\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x40\x01\xc0\x07\x00\x3c\x00\xe0\x00\xe0\x00'\
+b'\x78\x00\x0f\x00\x03\xc0\x00\x40\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\xff\xc0\xff\xc0\x00\x00\x00\x00\xff\xc0\xff\xc0\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\xe0\x00\x78\x00\x0e\x00\x03\xc0\x01\xc0'\
 b'\x07\x00\x3c\x00\xf0\x00\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0b\x00\x00\x00\x3c\x00\x7e\x00\xc7\x00\xc3\x00\x03\x00\x03\x00'\
-b'\x06\x00\x0c\x00\x08\x00\x18\x00\x18\x00\x00\x00\x00\x00\x18\x00'\
-b'\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x14\x00\x00\x00\x00\x03'\
-b'\xf0\x00\x0f\xfc\x00\x1e\x0f\x00\x38\x03\x80\x71\xe1\x80\x63\xe9'\
-b'\xc0\x67\x18\xc0\xce\x18\xc0\xcc\x18\xc0\xcc\x10\xc0\xcc\x31\x80'\
-b'\xce\x73\x80\x67\xff\x00\x63\x9e\x00\x30\x00\x00\x3c\x00\x00\x0f'\
-b'\xf8\x00\x03\xf0\x00\x00\x00\x00\x0d\x00\x00\x00\x07\x00\x07\x00'\
-b'\x07\x80\x0d\x80\x0d\x80\x08\xc0\x18\xc0\x18\xc0\x10\x60\x3f\xe0'\
-b'\x3f\xe0\x30\x30\x60\x30\x60\x38\xc0\x18\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0d\x00\x00\x00\xff\x00\xff\x80\xc1\xc0\xc0\xc0\xc0\xc0'\
-b'\xc1\xc0\xff\x00\xff\x80\xc0\xc0\xc0\x60\xc0\x60\xc0\x60\xc0\xe0'\
-b'\xff\xc0\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00'\
-b'\x0f\x80\x3f\xe0\x70\x60\x60\x30\xe0\x00\xc0\x00\xc0\x00\xc0\x00'\
-b'\xc0\x00\xc0\x00\xe0\x30\x60\x70\x70\x60\x3f\xe0\x0f\x80\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00\xff\x00\xff\x80\xc1\xc0'\
-b'\xc0\xc0\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60'\
-b'\xc0\xc0\xc1\xc0\xff\x80\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0d\x00\x00\x00\xff\xc0\xff\xc0\xc0\x00\xc0\x00\xc0\x00\xc0\x00'\
-b'\xff\x80\xff\x80\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xff\xc0'\
-b'\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\xff\x80'\
+b'\x00\x00\x3c\x00\x7e\x00\xc7\x00\xc3\x00\x03\x00\x03\x00\x06\x00'\
+b'\x0c\x00\x08\x00\x18\x00\x18\x00\x00\x00\x00\x00\x18\x00\x18\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x03\xf0\x00\x0f\xfc'\
+b'\x00\x1e\x0f\x00\x38\x03\x80\x71\xe1\x80\x63\xe9\xc0\x67\x18\xc0'\
+b'\xce\x18\xc0\xcc\x18\xc0\xcc\x10\xc0\xcc\x31\x80\xce\x73\x80\x67'\
+b'\xff\x00\x63\x9e\x00\x30\x00\x00\x3c\x00\x00\x0f\xf8\x00\x03\xf0'\
+b'\x00\x00\x00\x00\x00\x00\x07\x00\x07\x00\x07\x80\x0d\x80\x0d\x80'\
+b'\x08\xc0\x18\xc0\x18\xc0\x10\x60\x3f\xe0\x3f\xe0\x30\x30\x60\x30'\
+b'\x60\x38\xc0\x18\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00'\
+b'\xff\x80\xc1\xc0\xc0\xc0\xc0\xc0\xc1\xc0\xff\x00\xff\x80\xc0\xc0'\
+b'\xc0\x60\xc0\x60\xc0\x60\xc0\xe0\xff\xc0\xff\x80\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x0f\x80\x3f\xe0\x70\x60\x60\x30\xe0\x00'\
+b'\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xe0\x30\x60\x70\x70\x60'\
+b'\x3f\xe0\x0f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00'\
+b'\xff\x80\xc1\xc0\xc0\xc0\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60'\
+b'\xc0\x60\xc0\x60\xc0\xc0\xc1\xc0\xff\x80\xff\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\xff\xc0\xff\xc0\xc0\x00\xc0\x00\xc0\x00'\
+b'\xc0\x00\xff\x80\xff\x80\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00'\
+b'\xff\xc0\xff\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x80'\
 b'\xff\x80\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xff\x00\xff\x00\xc0\x00'\
 b'\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0f\x00\x00\x00\x0f\xc0\x3f\xf0\x38\x30\x60\x18'\
-b'\x60\x00\xc0\x00\xc0\x00\xc1\xf8\xc1\xf8\xc0\x18\xe0\x18\x60\x38'\
-b'\x78\x78\x3f\xd8\x0f\x88\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00'\
-b'\x00\x00\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xff\xe0'\
-b'\xff\xe0\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00\x00\xc0\xc0\xc0\xc0\xc0'\
-b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x00\x00\x00\x00\x0b\x00'\
-b'\x00\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00'\
-b'\x03\x00\x03\x00\x03\x00\xc3\x00\xc3\x00\xe7\x00\x7e\x00\x3c\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0d\x00\x00\x00\xc0\x60\xc0\xc0'\
-b'\xc1\x80\xc3\x00\xc6\x00\xcc\x00\xdc\x00\xf6\x00\xe6\x00\xc3\x00'\
-b'\xc1\x80\xc1\x80\xc0\xc0\xc0\x60\xc0\x60\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0b\x00\x00\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00'\
+b'\x00\x00\x00\x00\x00\x00\x0f\xc0\x3f\xf0\x38\x30\x60\x18\x60\x00'\
+b'\xc0\x00\xc0\x00\xc1\xf8\xc1\xf8\xc0\x18\xe0\x18\x60\x38\x78\x78'\
+b'\x3f\xd8\x0f\x88\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x60'\
+b'\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xff\xe0\xff\xe0\xc0\x60'\
+b'\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
+b'\xc0\xc0\xc0\xc0\x00\x00\x00\x00\x00\x00\x03\x00\x03\x00\x03\x00'\
+b'\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\xc3\x00'\
+b'\xc3\x00\xe7\x00\x7e\x00\x3c\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\xc0\x60\xc0\xc0\xc1\x80\xc3\x00\xc6\x00\xcc\x00\xdc\x00'\
+b'\xf6\x00\xe6\x00\xc3\x00\xc1\x80\xc1\x80\xc0\xc0\xc0\x60\xc0\x60'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x00\xc0\x00\xc0\x00'\
 b'\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00'\
-b'\xff\x80\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00\x11\x00\x00\x00'\
-b'\x00\xe0\x1c\x00\xe0\x1c\x00\xf0\x3c\x00\xf0\x3c\x00\xd0\x2c\x00'\
-b'\xd8\x6c\x00\xd8\x6c\x00\xc8\x4c\x00\xcc\xcc\x00\xcc\xcc\x00\xc4'\
-b'\x8c\x00\xc6\x8c\x00\xc7\x8c\x00\xc3\x0c\x00\xc3\x0c\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0f\x00\x00\x00\xe0\x60'\
+b'\xc0\x00\xc0\x00\xff\x80\xff\x80\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\xe0\x1c\x00\xe0\x1c\x00\xf0\x3c\x00\xf0\x3c\x00\xd0'\
+b'\x2c\x00\xd8\x6c\x00\xd8\x6c\x00\xc8\x4c\x00\xcc\xcc\x00\xcc\xcc'\
+b'\x00\xc4\x8c\x00\xc6\x8c\x00\xc7\x8c\x00\xc3\x0c\x00\xc3\x0c\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\x60'\
 b'\xe0\x60\xf0\x60\xf0\x60\xd8\x60\xd8\x60\xcc\x60\xc4\x60\xc6\x60'\
 b'\xc2\x60\xc3\x60\xc1\xe0\xc1\xe0\xc0\xe0\xc0\xe0\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x10\x00\x00\x00\x0f\xc0\x1f\xe0\x38\x70\x60\x18'\
-b'\x60\x1c\xc0\x0c\xc0\x0c\xc0\x0c\xc0\x0c\xc0\x0c\x60\x1c\x60\x18'\
-b'\x38\x70\x1f\xe0\x0f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x0d\x00'\
-b'\x00\x00\xff\x00\xff\x80\xc1\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc1\xc0'\
-b'\xff\x80\xff\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x10\x00\x00\x00\x0f\xc0\x1f\xe0'\
-b'\x38\x70\x60\x18\x60\x1c\xc0\x0c\xc0\x0c\xc0\x0c\xc0\x0c\xc0\x0c'\
-b'\x60\x18\x60\xd8\x38\x70\x1f\xf8\x0f\x98\x00\x08\x00\x00\x00\x00'\
-b'\x00\x00\x0e\x00\x00\x00\xff\x80\xff\xc0\xc0\xe0\xc0\x60\xc0\x60'\
-b'\xc0\x60\xc0\xc0\xff\x80\xff\xc0\xc0\xe0\xc0\x60\xc0\x60\xc0\x60'\
-b'\xc0\x60\xc0\x70\x00\x00\x00\x00\x00\x00\x00\x00\x0d\x00\x00\x00'\
-b'\x1f\x80\x7f\xe0\xe0\x70\xc0\x30\xc0\x00\xe0\x00\x78\x00\x3f\x80'\
-b'\x03\xe0\x00\x70\xc0\x30\xc0\x30\x70\x60\x7f\xe0\x1f\x80\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0d\x00\x00\x00\xff\xc0\xff\xc0\x0c\x00'\
-b'\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00'\
-b'\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0e\x00\x00\x00\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60'\
-b'\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\x60\xc0\x7f\xc0'\
-b'\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0d\x00\x00\x00\xc0\x30'\
+b'\x00\x00\x00\x00\x00\x00\x0f\xc0\x1f\xe0\x38\x70\x60\x18\x60\x1c'\
+b'\xc0\x0c\xc0\x0c\xc0\x0c\xc0\x0c\xc0\x0c\x60\x1c\x60\x18\x38\x70'\
+b'\x1f\xe0\x0f\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00'\
+b'\xff\x80\xc1\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc1\xc0\xff\x80\xff\x00'\
+b'\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x0f\xc0\x1f\xe0\x38\x70\x60\x18\x60\x1c'\
+b'\xc0\x0c\xc0\x0c\xc0\x0c\xc0\x0c\xc0\x0c\x60\x18\x60\xd8\x38\x70'\
+b'\x1f\xf8\x0f\x98\x00\x08\x00\x00\x00\x00\x00\x00\x00\x00\xff\x80'\
+b'\xff\xc0\xc0\xe0\xc0\x60\xc0\x60\xc0\x60\xc0\xc0\xff\x80\xff\xc0'\
+b'\xc0\xe0\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x70\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x1f\x80\x7f\xe0\xe0\x70\xc0\x30\xc0\x00'\
+b'\xe0\x00\x78\x00\x3f\x80\x03\xe0\x00\x70\xc0\x30\xc0\x30\x70\x60'\
+b'\x7f\xe0\x1f\x80\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xc0'\
+b'\xff\xc0\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00'\
+b'\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x0c\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60'\
+b'\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\xc0\x60\x60\xc0'\
+b'\x7f\xc0\x1f\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x30'\
 b'\x60\x30\x60\x30\x20\x20\x30\x60\x30\x60\x10\x40\x18\xc0\x18\xc0'\
 b'\x08\x80\x0d\x80\x0d\x80\x07\x00\x07\x00\x07\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x13\x00\x00\x00\x00\xc0\xc0\xc0\x60\xe0\xc0\x60'\
-b'\xe0\xc0\x61\xe0\xc0\x61\xb1\x80\x31\xb1\x80\x31\xb1\x80\x33\x11'\
-b'\x80\x33\x19\x00\x13\x1b\x00\x1f\x1b\x00\x1e\x0b\x00\x1e\x0e\x00'\
-b'\x0e\x0e\x00\x0c\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0d\x00\x00\x00\x60\x30\x30\x70\x30\x60\x18\xc0\x0c\xc0'\
-b'\x0d\x80\x07\x00\x07\x00\x07\x00\x0d\x80\x18\xc0\x18\xe0\x30\x60'\
-b'\x70\x30\x60\x38\x00\x00\x00\x00\x00\x00\x00\x00\x0e\x00\x00\x00'\
-b'\x60\x18\x70\x38\x30\x30\x18\x60\x18\x60\x0c\xc0\x0f\xc0\x07\x80'\
-b'\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x03\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00\xff\xe0\xff\xe0\x00\xc0'\
-b'\x01\x80\x03\x80\x03\x00\x06\x00\x0c\x00\x1c\x00\x38\x00\x30\x00'\
-b'\x60\x00\xc0\x00\xff\xe0\xff\xe0\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x06\x00\x00\xe0\xe0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
-b'\xc0\xc0\xc0\xc0\xe0\xe0\x06\x00\x00\x80\xc0\x40\x40\x60\x20\x20'\
-b'\x30\x10\x10\x18\x08\x08\x0c\x04\x00\x00\x00\x00\x06\x00\x00\xe0'\
-b'\xe0\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60'\
-b'\xe0\xe0\x09\x00\x00\x00\x00\x00\x18\x00\x38\x00\x28\x00\x2c\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\xc0\xc0\xc0\x60\xe0\xc0\x60\xe0\xc0'\
+b'\x61\xe0\xc0\x61\xb1\x80\x31\xb1\x80\x31\xb1\x80\x33\x11\x80\x33'\
+b'\x19\x00\x13\x1b\x00\x1f\x1b\x00\x1e\x0b\x00\x1e\x0e\x00\x0e\x0e'\
+b'\x00\x0c\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x60\x30\x30\x70\x30\x60\x18\xc0\x0c\xc0\x0d\x80\x07\x00'\
+b'\x07\x00\x07\x00\x0d\x80\x18\xc0\x18\xe0\x30\x60\x70\x30\x60\x38'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x60\x18\x70\x38\x30\x30'\
+b'\x18\x60\x18\x60\x0c\xc0\x0f\xc0\x07\x80\x03\x00\x03\x00\x03\x00'\
+b'\x03\x00\x03\x00\x03\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\xff\xe0\xff\xe0\x00\xc0\x01\x80\x03\x80\x03\x00\x06\x00'\
+b'\x0c\x00\x1c\x00\x38\x00\x30\x00\x60\x00\xc0\x00\xff\xe0\xff\xe0'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\xe0\xe0\xc0\xc0\xc0\xc0\xc0'\
+b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xe0\xe0\x00\x80\xc0\x40'\
+b'\x40\x60\x20\x20\x30\x10\x10\x18\x08\x08\x0c\x04\x00\x00\x00\x00'\
+b'\x00\xe0\xe0\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60\x60'\
+b'\x60\x60\xe0\xe0\x00\x00\x00\x00\x18\x00\x38\x00\x28\x00\x2c\x00'\
 b'\x64\x00\x46\x00\xc2\x00\x82\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0c\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf0'\
-b'\x00\x00\x00\x00\x00\x00\x05\x00\x00\xc0\x60\x30\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x3e\x00\xff\x80\xc1\x80\x01\x80'\
-b'\x01\x80\x3f\x80\xf1\x80\xc1\x80\xc3\x80\xff\xc0\x78\xc0\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\xc0\x00\xc0\x00\xc0\x00'\
-b'\xc0\x00\xdf\x00\xff\x80\xe1\x80\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
-b'\xc0\xc0\xe1\x80\xff\x80\xde\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1e\x00\x7f\x00'\
-b'\x61\x80\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xc1\x80\x63\x80\x7f\x00'\
-b'\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x01\x80'\
-b'\x01\x80\x01\x80\x01\x80\x3d\x80\x7f\x80\x63\x80\xc1\x80\xc1\x80'\
-b'\xc1\x80\xc1\x80\xc1\x80\x63\x80\x7f\x80\x3d\x80\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x3e\x00\x7f\x00\x63\x00\xc1\x80\xff\x80\xff\x80\xc0\x00\xc0\x00'\
-b'\x63\x80\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x06\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf0\x00\x00'\
+b'\x00\x00\x00\x00\x00\xc0\x60\x30\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x3e\x00\xff\x80\xc1\x80\x01\x80\x01\x80\x3f\x80\xf1\x80'\
+b'\xc1\x80\xc3\x80\xff\xc0\x78\xc0\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xdf\x00\xff\x80\xe1\x80'\
+b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xe1\x80\xff\x80\xde\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x1e\x00\x7f\x00\x61\x80\xc0\x00\xc0\x00\xc0\x00\xc0\x00'\
+b'\xc1\x80\x63\x80\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x01\x80\x01\x80\x01\x80\x01\x80\x3d\x80\x7f\x80\x63\x80'\
+b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\x63\x80\x7f\x80\x3d\x80'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x3e\x00\x7f\x00\x63\x00\xc1\x80\xff\x80\xff\x80\xc0\x00'\
+b'\xc0\x00\x63\x80\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x30\x70\x60\x60\xf0\xf0\x60\x60\x60\x60\x60\x60\x60\x60\x60'\
-b'\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x3d\x80\x7f\x80\x63\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80'\
-b'\x63\x80\x7f\x80\x3d\x80\x01\x80\xc3\x80\x7f\x00\x3e\x00\x0b\x00'\
-b'\x00\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00\xdf\x00\xdf\x80\xe3\x80'\
-b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\xc0\xc0\x00\x00\xc0'\
-b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x00\x00\x00\x00\x05\x00'\
-b'\x00\x30\x30\x00\x00\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30'\
-b'\x30\x30\xf0\xe0\x0a\x00\x00\x00\xc0\x00\xc0\x00\xc0\x00\xc0\x00'\
-b'\xc3\x00\xc6\x00\xcc\x00\xd8\x00\xf8\x00\xec\x00\xce\x00\xc6\x00'\
-b'\xc3\x00\xc3\x00\xc1\x80\x00\x00\x00\x00\x00\x00\x00\x00\x04\x00'\
-b'\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
-b'\x00\x00\x00\x00\x10\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\xde\x78\xfe\xfc\xe3\x8c\xc3\x0c\xc3\x0c\xc3\x0c\xc3\x0c\xc3\x0c'\
-b'\xc3\x0c\xc3\x0c\xc3\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3d\x80'\
+b'\x7f\x80\x63\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\x63\x80'\
+b'\x7f\x80\x3d\x80\x01\x80\xc3\x80\x7f\x00\x3e\x00\x00\x00\xc0\x00'\
+b'\xc0\x00\xc0\x00\xc0\x00\xdf\x00\xdf\x80\xe3\x80\xc1\x80\xc1\x80'\
+b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\xc0\xc0\x00\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
+b'\xc0\xc0\xc0\xc0\x00\x00\x00\x00\x00\x30\x30\x00\x00\x30\x30\x30'\
+b'\x30\x30\x30\x30\x30\x30\x30\x30\x30\x30\xf0\xe0\x00\x00\xc0\x00'\
+b'\xc0\x00\xc0\x00\xc0\x00\xc3\x00\xc6\x00\xcc\x00\xd8\x00\xf8\x00'\
+b'\xec\x00\xce\x00\xc6\x00\xc3\x00\xc3\x00\xc1\x80\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
+b'\xc0\xc0\xc0\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\xde\x78\xfe\xfc\xe3\x8c\xc3\x0c\xc3\x0c\xc3\x0c\xc3\x0c'\
+b'\xc3\x0c\xc3\x0c\xc3\x0c\xc3\x0c\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xcf\x00\xdf\x80\xe3\x80'\
 b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x3e\x00\x7f\x00\x63\x00\xc1\x80\xc1\x80\xc1\x80'\
-b'\xc1\x80\xc1\x80\x63\x00\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00'\
-b'\x00\x00\x0b\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\x00'\
-b'\xff\x80\xe1\x80\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xe1\x80'\
-b'\xff\x80\xde\x00\xc0\x00\xc0\x00\xc0\x00\x00\x00\x0b\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x3d\x80\x7f\x80\x63\x80\xc1\x80'\
-b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\x63\x80\x7f\x80\x3d\x80\x01\x80'\
-b'\x01\x80\x01\x80\x00\x00\x07\x00\x00\x00\x00\x00\x00\xd8\xf8\xe0'\
-b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x00\x00\x00\x00\x0a\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x3c\x00\x7f\x00\xc3\x00\xc0\x00'\
-b'\xf0\x00\x7e\x00\x0f\x00\x03\x00\xc3\x00\xfe\x00\x7c\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x06\x00\x00\x00\x00\x60\x60\xf0\xf0\x60'\
-b'\x60\x60\x60\x60\x60\x60\x70\x70\x00\x00\x00\x00\x0b\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\xc1\x80\xc1\x80\xc1\x80\xc1\x80'\
-b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xe3\x80\xfd\x80\x79\x80\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x0a\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x3e\x00\x7f\x00\x63\x00\xc1\x80\xc1\x80\xc1\x80\xc1\x80'\
+b'\xc1\x80\x63\x00\x7f\x00\x3e\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xde\x00\xff\x80\xe1\x80'\
+b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xe1\x80\xff\x80\xde\x00'\
+b'\xc0\x00\xc0\x00\xc0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x3d\x80\x7f\x80\x63\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80'\
+b'\xc1\x80\x63\x80\x7f\x80\x3d\x80\x01\x80\x01\x80\x01\x80\x00\x00'\
+b'\x00\x00\x00\x00\x00\xd8\xf8\xe0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x3c\x00'\
+b'\x7f\x00\xc3\x00\xc0\x00\xf0\x00\x7e\x00\x0f\x00\x03\x00\xc3\x00'\
+b'\xfe\x00\x7c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x60'\
+b'\x60\xf0\xf0\x60\x60\x60\x60\x60\x60\x60\x70\x70\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc1\x80\xc1\x80\xc1\x80'\
+b'\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xc1\x80\xe3\x80\xfd\x80\x79\x80'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\xc0\xc0\x61\x80\x61\x80\x61\x00\x23\x00\x33\x00\x32\x00'\
 b'\x16\x00\x1e\x00\x1c\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\x0e\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x0c\xc3\x8c'\
-b'\x63\x8c\x67\x88\x66\x98\x24\xd8\x34\xd0\x3c\xd0\x3c\x70\x18\x70'\
-b'\x18\x60\x00\x00\x00\x00\x00\x00\x00\x00\x0a\x00\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x00\x00\x61\x80\x63\x00\x33\x00\x1e\x00\x1c\x00'\
-b'\x0c\x00\x1c\x00\x16\x00\x33\x00\x63\x00\x41\x80\x00\x00\x00\x00'\
-b'\x00\x00\x00\x00\x0a\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
-b'\xc0\x80\x41\x80\x61\x80\x61\x00\x23\x00\x33\x00\x32\x00\x16\x00'\
-b'\x1c\x00\x1c\x00\x0c\x00\x08\x00\x18\x00\x78\x00\x70\x00\x0a\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x00\xff\x00\x06\x00'\
-b'\x06\x00\x0c\x00\x18\x00\x30\x00\x60\x00\xc0\x00\xff\x00\xff\x00'\
-b'\x00\x00\x00\x00\x00\x00\x00\x00\x07\x00\x00\x18\x38\x30\x30\x30'\
-b'\x30\x30\x30\x70\xc0\x70\x30\x30\x30\x30\x30\x30\x38\x18\x05\x00'\
-b'\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
-b'\xc0\xc0\xc0\xc0\x07\x00\x00\xc0\xe0\x60\x60\x60\x60\x60\x60\x70'\
-b'\x18\x70\x60\x60\x60\x60\x60\x60\xe0\xc0\x0a\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc3\x0c\xc3\x8c\x63\x8c'\
+b'\x67\x88\x66\x98\x24\xd8\x34\xd0\x3c\xd0\x3c\x70\x18\x70\x18\x60'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x61\x80\x63\x00\x33\x00\x1e\x00\x1c\x00\x0c\x00\x1c\x00'\
+b'\x16\x00\x33\x00\x63\x00\x41\x80\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xc0\x80\x41\x80\x61\x80'\
+b'\x61\x00\x23\x00\x33\x00\x32\x00\x16\x00\x1c\x00\x1c\x00\x0c\x00'\
+b'\x08\x00\x18\x00\x78\x00\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x00\xff\x00\xff\x00\x06\x00\x06\x00\x0c\x00\x18\x00\x30\x00'\
+b'\x60\x00\xc0\x00\xff\x00\xff\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
+b'\x00\x18\x38\x30\x30\x30\x30\x30\x30\x70\xc0\x70\x30\x30\x30\x30'\
+b'\x30\x30\x38\x18\x00\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0'\
+b'\xc0\xc0\xc0\xc0\xc0\xc0\xc0\xc0\x00\xc0\xe0\x60\x60\x60\x60\x60'\
+b'\x60\x70\x18\x70\x60\x60\x60\x60\x60\x60\xe0\xc0\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x60\x00\xf1\x00\x9f\x00'\
 b'\x06\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'\
 b'\x00\x00\x00\x00'
 
-_index =\
-b'\x00\x00\x2a\x00\x2a\x00\x40\x00\x40\x00\x56\x00\x56\x00\x6c\x00'\
-b'\x6c\x00\x96\x00\x96\x00\xc0\x00\xc0\x00\xfe\x00\xfe\x00\x28\x01'\
-b'\x28\x01\x3e\x01\x3e\x01\x54\x01\x54\x01\x6a\x01\x6a\x01\x80\x01'\
-b'\x80\x01\xaa\x01\xaa\x01\xc0\x01\xc0\x01\xd6\x01\xd6\x01\xec\x01'\
-b'\xec\x01\x02\x02\x02\x02\x2c\x02\x2c\x02\x56\x02\x56\x02\x80\x02'\
-b'\x80\x02\xaa\x02\xaa\x02\xd4\x02\xd4\x02\xfe\x02\xfe\x02\x28\x03'\
-b'\x28\x03\x52\x03\x52\x03\x7c\x03\x7c\x03\xa6\x03\xa6\x03\xbc\x03'\
-b'\xbc\x03\xd2\x03\xd2\x03\xfc\x03\xfc\x03\x26\x04\x26\x04\x50\x04'\
-b'\x50\x04\x7a\x04\x7a\x04\xb8\x04\xb8\x04\xe2\x04\xe2\x04\x0c\x05'\
-b'\x0c\x05\x36\x05\x36\x05\x60\x05\x60\x05\x8a\x05\x8a\x05\xb4\x05'\
-b'\xb4\x05\xde\x05\xde\x05\x08\x06\x08\x06\x1e\x06\x1e\x06\x48\x06'\
-b'\x48\x06\x72\x06\x72\x06\x9c\x06\x9c\x06\xda\x06\xda\x06\x04\x07'\
-b'\x04\x07\x2e\x07\x2e\x07\x58\x07\x58\x07\x82\x07\x82\x07\xac\x07'\
-b'\xac\x07\xd6\x07\xd6\x07\x00\x08\x00\x08\x2a\x08\x2a\x08\x54\x08'\
-b'\x54\x08\x92\x08\x92\x08\xbc\x08\xbc\x08\xe6\x08\xe6\x08\x10\x09'\
-b'\x10\x09\x26\x09\x26\x09\x3c\x09\x3c\x09\x52\x09\x52\x09\x7c\x09'\
-b'\x7c\x09\xa6\x09\xa6\x09\xbc\x09\xbc\x09\xe6\x09\xe6\x09\x10\x0a'\
-b'\x10\x0a\x3a\x0a\x3a\x0a\x64\x0a\x64\x0a\x8e\x0a\x8e\x0a\xa4\x0a'\
-b'\xa4\x0a\xce\x0a\xce\x0a\xf8\x0a\xf8\x0a\x0e\x0b\x0e\x0b\x24\x0b'\
-b'\x24\x0b\x4e\x0b\x4e\x0b\x64\x0b\x64\x0b\x8e\x0b\x8e\x0b\xb8\x0b'\
-b'\xb8\x0b\xe2\x0b\xe2\x0b\x0c\x0c\x0c\x0c\x36\x0c\x36\x0c\x4c\x0c'\
-b'\x4c\x0c\x76\x0c\x76\x0c\x8c\x0c\x8c\x0c\xb6\x0c\xb6\x0c\xe0\x0c'\
-b'\xe0\x0c\x0a\x0d\x0a\x0d\x34\x0d\x34\x0d\x5e\x0d\x5e\x0d\x88\x0d'\
-b'\x88\x0d\x9e\x0d\x9e\x0d\xb4\x0d\xb4\x0d\xca\x0d\xca\x0d\xf4\x0d'\
+_offsets = array('H',
+    b'\x00\x00\x28\x00\x3c\x00\x50\x00\x64\x00\x8c\x00\xb4\x00\xf0\x00'
+    b'\x18\x01\x2c\x01\x40\x01\x54\x01\x68\x01\x90\x01\xa4\x01\xb8\x01'
+    b'\xcc\x01\xe0\x01\x08\x02\x30\x02\x58\x02\x80\x02\xa8\x02\xd0\x02'
+    b'\xf8\x02\x20\x03\x48\x03\x70\x03\x84\x03\x98\x03\xc0\x03\xe8\x03'
+    b'\x10\x04\x38\x04\x74\x04\x9c\x04\xc4\x04\xec\x04\x14\x05\x3c\x05'
+    b'\x64\x05\x8c\x05\xb4\x05\xc8\x05\xf0\x05\x18\x06\x40\x06\x7c\x06'
+    b'\xa4\x06\xcc\x06\xf4\x06\x1c\x07\x44\x07\x6c\x07\x94\x07\xbc\x07'
+    b'\xe4\x07\x20\x08\x48\x08\x70\x08\x98\x08\xac\x08\xc0\x08\xd4\x08'
+    b'\xfc\x08\x24\x09\x38\x09\x60\x09\x88\x09\xb0\x09\xd8\x09\x00\x0a'
+    b'\x14\x0a\x3c\x0a\x64\x0a\x78\x0a\x8c\x0a\xb4\x0a\xc8\x0a\xf0\x0a'
+    b'\x18\x0b\x40\x0b\x68\x0b\x90\x0b\xa4\x0b\xcc\x0b\xe0\x0b\x08\x0c'
+    b'\x30\x0c\x58\x0c\x80\x0c\xa8\x0c\xd0\x0c\xe4\x0c\xf8\x0c\x0c\x0d'
+    b'\x34\x0d')
 
 _mvfont = memoryview(_font)
 
+# Advance and printable width (trailing blank columns dropped) of each slot
+_widths = array('B',
+    b'\x0b\x05\x07\x07\x0b\x0b\x12\x0d\x04\x07\x07\x08\x0c\x06\x07\x05'
+    b'\x06\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x05\x05\x0c\x0c\x0c'
+    b'\x0b\x14\x0d\x0d\x0e\x0e\x0d\x0c\x0f\x0e\x06\x0b\x0d\x0b\x11\x0f'
+    b'\x10\x0d\x10\x0e\x0d\x0d\x0e\x0d\x13\x0d\x0e\x0c\x06\x06\x06\x09'
+    b'\x0c\x05\x0b\x0b\x0a\x0b\x0b\x06\x0b\x0b\x04\x05\x0a\x04\x10\x0b'
+    b'\x0b\x0b\x0b\x07\x0a\x06\x0b\x0a\x0e\x0a\x0a\x0a\x07\x05\x07\x0a')
+_true_widths = array('B',
+    b'\x0b\x01\x02\x05\x0a\x0b\x12\x0d\x02\x04\x02\x03\x0c\x02\x05\x02'
+    b'\x06\x0b\x0b\x0b\x0b\x0b\x0b\x0b\x09\x0b\x0b\x02\x02\x0a\x0a\x0b'
+    b'\x0b\x14\x0a\x0d\x0b\x0e\x0a\x09\x0a\x0b\x02\x0a\x0b\x0a\x09\x0b'
+    b'\x0a\x0d\x0a\x0a\x0b\x0a\x0b\x0c\x12\x0c\x0d\x0b\x03\x02\x03\x01'
+    b'\x0c\x02\x0b\x0a\x0a\x09\x0b\x04\x09\x0a\x02\x04\x0a\x02\x0d\x0a'
+    b'\x0b\x0a\x09\x05\x0a\x03\x09\x0a\x0e\x09\x09\x0a\x05\x02\x02\x0a')
+
+def widths():
+    return _widths
+
+def true_widths():
+    return _true_widths
+
 def get_ch(ch):
     ordch = ord(ch)
-    ordch = ordch + 1 if ordch >= 32 and ordch <= 126 else 32
-    idx_offs = 4 * (ordch - 32)
-    offset = int.from_bytes(_index[idx_offs : idx_offs + 2], 'little')
-    next_offs = int.from_bytes(_index[idx_offs + 2 : idx_offs + 4], 'little')
-    width = int.from_bytes(_font[offset:offset + 2], 'little')
-    return _mvfont[offset + 2:next_offs], 20, width
- 
+    slot = ordch - 31 if 32 <= ordch <= 126 else 0
+    return _mvfont[_offsets[slot]:_offsets[slot + 1]], 20, _widths[slot]
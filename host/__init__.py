@@ -0,0 +1,63 @@
+# Host (CPython) stand-ins for the MicroPython modules the calendar uses.
+#
+# install() puts the stand-ins and the firmware sources on sys.path, adds
+# the MicroPython-only extensions to the modules CPython already provides
+# (time, gc, sys), registers canned service responses and attaches a
+# recording panel to the SPI bus:
+#
+#     import host
+#     panel = host.install()
+#     import main
+#     main.calendar_update()
+#     panel.save_png('frame.png')
+#
+# python -m host does exactly that, see __main__.py.
+
+import os
+import sys
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(HOST_DIR)
+
+HEAP_BYTES = 200 * 1024  # Reported by gc.mem_free(), roughly an RP2040 heap
+
+_panel = None
+
+
+def _print_exception(e, file=None):
+    import traceback
+    traceback.print_exception(type(e), e, e.__traceback__, file=file or sys.stdout)
+
+
+def install():
+    global _panel
+    if _panel is not None:
+        return _panel
+
+    # Stand-ins first so they shadow CPython's own secrets module, firmware
+    # sources next so calendar.py shadows CPython's calendar
+    for path in (ROOT_DIR, HOST_DIR):
+        if path in sys.path:
+            sys.path.remove(path)
+    sys.path[:0] = [HOST_DIR, ROOT_DIR]
+    for name in ('calendar', 'secrets'):
+        module = sys.modules.get(name)
+        if module is not None and not getattr(module, '__file__', '').startswith((HOST_DIR, ROOT_DIR)):
+            del sys.modules[name]
+
+    import gc
+    import time
+    import utime
+    for name in ('sleep', 'sleep_ms', 'sleep_us', 'ticks_ms', 'ticks_us',
+                 'ticks_cpu', 'ticks_add', 'ticks_diff', 'mktime'):
+        setattr(time, name, getattr(utime, name))
+    gc.mem_free = lambda: HEAP_BYTES
+    gc.mem_alloc = lambda: 0
+    gc.threshold = lambda *args: -1
+    sys.print_exception = _print_exception
+
+    import fixtures
+    from panel import Panel
+    fixtures.install()
+    _panel = Panel().attach()
+    return _panel
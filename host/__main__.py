@@ -0,0 +1,47 @@
+# python -m host [--profile] [output directory]
+#
+# Runs main.calendar_update() on CPython against the stand-ins and canned
+# service responses, then writes the refreshed frame (frame.png, black.pbm,
+# red.pbm) and prints the recorded SPI statistics. Files the firmware
+# writes (frame store, logs) also end up in the output directory.
+# Set HOST_EPOCH to a Unix time to render a fixed date.
+
+import argparse
+import os
+import time
+
+import host
+
+
+def run(out, profile=False):
+    panel = host.install()
+    os.makedirs(out, exist_ok=True)
+    os.chdir(out)
+
+    import main
+    start = time.perf_counter()
+    if profile:
+        import cProfile
+        import pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(main.calendar_update)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+    else:
+        main.calendar_update()
+    elapsed = time.perf_counter() - start
+
+    print('Host run took {:.3f} s (CPU, panel delays excluded)'.format(elapsed))
+    for key, value in panel.report().items():
+        print('  {}: {}'.format(key, value))
+    panel.save_png('frame.png')
+    panel.save_pbm('black.pbm', 'black')
+    panel.save_pbm('red.pbm', 'red')
+    print('Frame written to {}'.format(os.path.join(os.getcwd(), 'frame.png')))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='python -m host')
+    parser.add_argument('out', nargs='?', default='host-out')
+    parser.add_argument('--profile', action='store_true', help='profile calendar_update()')
+    args = parser.parse_args()
+    run(os.path.abspath(args.out), args.profile)
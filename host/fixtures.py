@@ -0,0 +1,109 @@
+# Canned responses for the services calendar_update() talks to, generated
+# around the host's current date.
+
+import os
+import re
+import time
+
+import secrets
+import urequests
+
+FRACTIONS = ['Restafval', 'PMD', 'Papier-Karton', 'GFT']
+
+
+def _date(url, name):
+    m = re.search(name + r'=?/?(\d{4})-(\d\d)-(\d\d)', url)
+    if m is None:
+        return time.localtime()
+    return time.localtime(time.mktime((int(m.group(1)), int(m.group(2)), int(m.group(3)), 12, 0, 0, 0, 0, -1)))
+
+
+def _iso(t):
+    return '{:04d}-{:02d}-{:02d}'.format(t[0], t[1], t[2])
+
+
+def now(url):
+    # HOST_EPOCH pins the clock so runs are reproducible
+    seconds = float(os.environ.get('HOST_EPOCH') or time.time())
+    return {'milliseconds_since_epoch': int(seconds * 1000)}
+
+
+def token(url):
+    return {'accessToken': 'host-token'}
+
+
+def schedule(url):
+    start = _date(url, 'from')
+    items = []
+    for n in range(8):
+        t = time.localtime(time.mktime(start) + n * 86400)
+        if n % 3 == 1:
+            items.append({'timestamp': _iso(t) + 'T00:00:00+02:00',
+                          'fraction': {'name': {'nl': FRACTIONS[n % len(FRACTIONS)]}}})
+    return {'items': items}
+
+
+def weather(url):
+    m = re.search(r'/(\d{4}-\d\d-\d\d)/(\d{4}-\d\d-\d\d)', url)
+    start = _date(m.group(1) if m else url, '')
+    days = []
+    for n in range(2):
+        t = time.localtime(time.mktime(start) + n * 86400)
+        days.append({'datetime': _iso(t), 'temp': 14.5 - n, 'tempmin': 9.1 - n,
+                     'tempmax': 17.3 - n, 'preciptype': ['rain'] if n else None,
+                     'precipprob': 60.0 if n else 5.0})
+    return {'days': days}
+
+
+def ics(url):
+    # A few hundred KB of events over several years, a handful of them in
+    # the current month, with folded lines and escaped text
+    seconds = float(os.environ.get('HOST_EPOCH') or time.time())
+    today = time.localtime(seconds)
+    lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:-//host//fixtures//EN']
+    base = time.mktime((today[0] - 3, 1, 1, 12, 0, 0, 0, 0, -1))
+    for n in range(2500):
+        t = time.localtime(base + n * 86400 * 7 // 5)
+        lines += ['BEGIN:VEVENT', 'UID:host-{}@fixtures'.format(n),
+                  'DTSTART:{:04d}{:02d}{:02d}T{:02d}3000'.format(t[0], t[1], t[2], 8 + n % 10),
+                  'DTEND:{:04d}{:02d}{:02d}T{:02d}0000'.format(t[0], t[1], t[2], 10 + n % 10),
+                  'SUMMARY:Appointment {}'.format(n),
+                  'DESCRIPTION:' + 'Lorem ipsum dolor sit amet, consectetur adipiscing elit. ' * 3,
+                  ' continued on a folded line',
+                  'END:VEVENT']
+    month_events = (
+        (today[2], 1, 'Dentist\\, Anna'),
+        (today[2] + 2, 1, 'School trip'),
+        (today[2] + 5, 3, 'Grandparents visi'),
+        (today[2] - 3, 1, 'Birthday Lena'),
+    )
+    for mday, days, summary in month_events:
+        start = time.localtime(time.mktime((today[0], today[1], mday, 12, 0, 0, 0, 0, -1)))
+        end = time.localtime(time.mktime((today[0], today[1], mday + days, 12, 0, 0, 0, 0, -1)))
+        lines += ['BEGIN:VEVENT', 'UID:month-{}@fixtures'.format(mday),
+                  'DTSTART;VALUE=DATE:{:04d}{:02d}{:02d}'.format(start[0], start[1], start[2]),
+                  'DTEND;VALUE=DATE:{:04d}{:02d}{:02d}'.format(end[0], end[1], end[2]),
+                  'SUMMARY:' + summary[:-1],
+                  ' ' + summary[-1:],
+                  'END:VEVENT']
+    # Recurring events that started years ago
+    start = time.localtime(base)
+    for uid, rule, summary in (('swim', 'FREQ=WEEKLY;INTERVAL=2;BYDAY=TU', 'Swimming'),
+                               ('club', 'FREQ=MONTHLY;BYDAY=-1FR', 'Book club'),
+                               ('bins', 'FREQ=MONTHLY;BYMONTHDAY=1,15;COUNT=200', 'Clean bins')):
+        lines += ['BEGIN:VEVENT', 'UID:{}@fixtures'.format(uid),
+                  'DTSTART:{:04d}{:02d}{:02d}T190000'.format(start[0], start[1], start[2]),
+                  'DTEND:{:04d}{:02d}{:02d}T203000'.format(start[0], start[1], start[2]),
+                  'RRULE:' + rule,
+                  'SUMMARY:' + summary,
+                  'END:VEVENT']
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(lines) + '\r\n'
+
+
+def install():
+    urequests.route('http://date.jsontest.com', now)
+    urequests.route(secrets.GARBAGE_TOKEN_URL, token)
+    urequests.route(secrets.GARBAGE_SCHEDULE_URL.split('{')[0], schedule)
+    urequests.route('https://weather.visualcrossing.com', weather)
+    urequests.route(secrets.ICS_URL, ics)
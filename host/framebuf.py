@@ -0,0 +1,147 @@
+# Host stand-in for MicroPython's framebuf, pure Python.
+#
+# Supports the monochrome horizontal formats the calendar uses. text()
+# draws an 8x8 approximation of the firmware font, derived by scaling the
+# Courier glyphs down, so exported frames stay readable.
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+_font8 = {}
+
+
+def _glyph8(ch):
+    g = _font8.get(ch)
+    if g is None:
+        import courier20
+        glyph, height, width = courier20.get_ch(ch)
+        stride = (width + 7) // 8
+        rows = []
+        for ty in range(8):
+            bits = 0
+            for tx in range(8):
+                ink = 0
+                y0, y1 = 3 + ty * 15 // 8, 3 + (ty + 1) * 15 // 8
+                x0, x1 = 1 + tx * 12 // 8, 1 + (tx + 1) * 12 // 8
+                for y in range(y0, max(y1, y0 + 1)):
+                    for x in range(x0, max(x1, x0 + 1)):
+                        if glyph[y * stride + (x >> 3)] & (0x80 >> (x & 7)):
+                            ink += 1
+                if ink * 3 >= max(1, (y1 - y0) * (x1 - x0)):
+                    bits |= 0x80 >> tx
+            rows.append(bits)
+        g = _font8[ch] = bytes(rows)
+    return g
+
+
+class FrameBuffer:
+    def __init__(self, buffer, width, height, format, stride=None):
+        if format not in (MONO_HLSB, MONO_HMSB):
+            raise ValueError('format not supported on the host')
+        self._buf = buffer
+        self._w = width
+        self._h = height
+        self._format = format
+        self._stride = (width + 7) // 8
+
+    def _set(self, x, y, c):
+        i = y * self._stride + (x >> 3)
+        bit = 0x80 >> (x & 7) if self._format == MONO_HLSB else 1 << (x & 7)
+        if c:
+            self._buf[i] |= bit
+        else:
+            self._buf[i] &= ~bit & 0xff
+
+    def _get(self, x, y):
+        i = y * self._stride + (x >> 3)
+        bit = 0x80 >> (x & 7) if self._format == MONO_HLSB else 1 << (x & 7)
+        return 1 if self._buf[i] & bit else 0
+
+    def fill(self, c):
+        n = self._stride * self._h
+        self._buf[:n] = (b'\xff' if c else b'\x00') * n
+
+    # Drawing methods only call the private helpers, never each other, so
+    # Python subclasses overriding them see the same behaviour as on the
+    # device, where they are implemented in C
+
+    def _pixel(self, x, y, c):
+        if 0 <= x < self._w and 0 <= y < self._h:
+            self._set(x, y, c)
+
+    def _fill_rect(self, x, y, w, h, c):
+        x0, x1 = max(x, 0), min(x + w, self._w)
+        y0, y1 = max(y, 0), min(y + h, self._h)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                self._set(xx, yy, c)
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._w and 0 <= y < self._h):
+            return None
+        if c is None:
+            return self._get(x, y)
+        self._set(x, y, c)
+
+    def fill_rect(self, x, y, w, h, c):
+        self._fill_rect(x, y, w, h, c)
+
+    def hline(self, x, y, w, c):
+        self._fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self._fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self._fill_rect(x, y, w, h, c)
+            return
+        self._fill_rect(x, y, w, 1, c)
+        self._fill_rect(x, y + h - 1, w, 1, c)
+        self._fill_rect(x, y, 1, h, c)
+        self._fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx, dy = abs(x2 - x1), -abs(y2 - y1)
+        sx, sy = (1 if x1 < x2 else -1), (1 if y1 < y2 else -1)
+        err = dx + dy
+        while True:
+            self._pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                break
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def text(self, s, x, y, c=1):
+        for ch in s:
+            rows = _glyph8(ch)
+            for gy in range(8):
+                bits = rows[gy]
+                if not bits:
+                    continue
+                for gx in range(8):
+                    if bits & (0x80 >> gx):
+                        self._pixel(x + gx, y + gy, c)
+            x += 8
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        x0, x1 = max(x, 0), min(x + fbuf._w, self._w)
+        y0, y1 = max(y, 0), min(y + fbuf._h, self._h)
+        for yy in range(y0, y1):
+            for xx in range(x0, x1):
+                c = fbuf._get(xx - x, yy - y)
+                if palette is not None:
+                    c = palette._get(c, 0)
+                if c != key:
+                    self._set(xx, yy, c)
+
+    def scroll(self, xstep, ystep):
+        src = bytes(self._buf)
+        copy = FrameBuffer(bytearray(src), self._w, self._h, self._format)
+        FrameBuffer.blit(self, copy, xstep, ystep)
@@ -0,0 +1,146 @@
+# Host stand-in for the machine module.
+#
+# Pins keep their levels in a shared table so a simulated peripheral (see
+# panel.py) can observe DC/CS and drive input pins such as BUSY. SPI writes
+# are forwarded to whatever sink is attached to SPI.sink.
+
+import utime
+
+
+class Pin:
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    _levels = {}     # Pin id -> last level written or read
+    _inputs = {}     # Pin id -> callable returning the externally driven level
+    _irqs = {}       # Pin id -> (handler, trigger, Pin)
+    _listeners = []  # Callables (pin_id, level) notified on output changes
+
+    def __init__(self, id, mode=-1, pull=-1, value=None):
+        self.id = id
+        self.mode = mode
+        self.pull = pull
+        if id not in Pin._levels:
+            Pin._levels[id] = 1 if pull == Pin.PULL_UP else 0
+        if value is not None:
+            self.value(value)
+
+    def value(self, v=None):
+        if v is None:
+            Pin._poll()
+            return Pin._levels[self.id]
+        v = 1 if v else 0
+        if Pin._levels.get(self.id) != v:
+            Pin._levels[self.id] = v
+            for listener in Pin._listeners:
+                listener(self.id, v)
+        return None
+
+    __call__ = value
+
+    def on(self):
+        self.value(1)
+
+    def off(self):
+        self.value(0)
+
+    high = on
+    low = off
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING, hard=False):
+        if handler is None:
+            Pin._irqs.pop(self.id, None)
+        else:
+            Pin._irqs[self.id] = (handler, trigger, self)
+        return self
+
+    @staticmethod
+    def _poll():
+        # Refresh externally driven inputs and fire edge handlers
+        for pin_id, source in Pin._inputs.items():
+            level = 1 if source() else 0
+            old = Pin._levels.get(pin_id)
+            Pin._levels[pin_id] = level
+            if old is None or old == level or pin_id not in Pin._irqs:
+                continue
+            handler, trigger, pin = Pin._irqs[pin_id]
+            if (level and trigger & Pin.IRQ_RISING) or (not level and trigger & Pin.IRQ_FALLING):
+                handler(pin)
+
+
+class SPI:
+    MSB = 0
+    LSB = 1
+
+    sink = None  # Receives write(buf) / read(nbytes) calls, see panel.Panel
+
+    def __init__(self, id, baudrate=1000000, **kwargs):
+        self.id = id
+        self.baudrate = baudrate
+
+    def init(self, baudrate=None, **kwargs):
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def deinit(self):
+        pass
+
+    def write(self, buf):
+        # Account for the time the bytes would spend on the wire
+        utime.sleep_us(len(buf) * 8000000 // self.baudrate)
+        if SPI.sink is not None:
+            SPI.sink.write(buf, self.baudrate)
+
+    def read(self, nbytes, write=0x00):
+        buf = bytearray(nbytes)
+        self.readinto(buf, write)
+        return bytes(buf)
+
+    def readinto(self, buf, write=0x00):
+        if SPI.sink is not None:
+            SPI.sink.readinto(buf)
+        else:
+            for i in range(len(buf)):
+                buf[i] = write
+
+
+class RTC:
+    def __init__(self):
+        self._offset = None
+
+    def datetime(self, dt=None):
+        if dt is None:
+            t = utime.localtime()
+            return (t[0], t[1], t[2], t[6], t[3], t[4], t[5], 0)
+        self._offset = dt
+        return None
+
+
+def idle():
+    utime.sleep_ms(1)
+    Pin._poll()
+
+
+def lightsleep(ms=None):
+    utime.sleep_ms(ms or 0)
+    Pin._poll()
+
+
+deepsleep = lightsleep
+
+
+def freq(hz=None):
+    return 125000000
+
+
+def unique_id():
+    return b'host0000'
+
+
+def reset():
+    raise SystemExit('machine.reset()')
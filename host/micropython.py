@@ -0,0 +1,26 @@
+# Host stand-in for the micropython module.
+
+
+def const(value):
+    return value
+
+
+def native(f):
+    return f
+
+
+def viper(f):
+    return f
+
+
+def alloc_emergency_exception_buf(size):
+    pass
+
+
+def mem_info(verbose=False):
+    import gc
+    print('mem: total={} free={}'.format(gc.mem_alloc() + gc.mem_free(), gc.mem_free()))
+
+
+def schedule(func, arg):
+    func(arg)
@@ -0,0 +1,165 @@
+# Recording stand-in for the Waveshare 7.5" B panel controller.
+#
+# The Panel watches DC/CS through machine.Pin, receives every SPI write,
+# counts bytes and CS-framed transactions, decodes the 0x10/0x13 plane
+# transfers (including 0x90/0x91 partial windows) into frame memory and
+# drives BUSY low for a simulated time after power and refresh commands.
+# The last refreshed frame can be exported as PBM or PNG.
+
+import struct
+import zlib
+
+import machine
+import utime
+
+
+class Panel:
+    # Simulated busy times, ms
+    BUSY_MS = {0x04: 100, 0x02: 50, 0x12: 15000}
+    STATUS = 0x01  # Returned for 0x71 (get status): bit 0 = not busy
+    MAX_BAUDRATE = 20000000  # Faster writes are garbled
+
+    def __init__(self, width=800, height=480, dc=8, cs=9, busy=13):
+        self.width = width
+        self.height = height
+        self.wide = (width + 7) // 8
+        self.dc = dc
+        self.cs = cs
+        self.busy = busy
+        self.black = bytearray(b'\xff' * (self.wide * height))
+        self.red = bytearray(self.wide * height)
+        self.shown_black = None
+        self.shown_red = None
+        self.reset_counters()
+        self._busy_until = 0
+        self._command = None
+        self._args = bytearray()
+        self._pos = 0
+        self._window = None
+        self._partial = False
+
+    def reset_counters(self):
+        self.bytes = 0
+        self.data_bytes = 0
+        self.transactions = 0
+        self.writes = 0
+        self.commands = {}
+        self.refreshes = 0
+
+    def attach(self):
+        machine.SPI.sink = self
+        machine.Pin._inputs[self.busy] = self.busy_level
+        machine.Pin._listeners.append(self._pin_changed)
+        return self
+
+    def busy_level(self):
+        # BUSY is low while the controller works
+        return 0 if utime.ticks_diff(self._busy_until, utime.ticks_ms()) > 0 else 1
+
+    def _pin_changed(self, pin_id, level):
+        if pin_id == self.cs and level == 0:
+            self.transactions += 1
+
+    def write(self, buf, baudrate):
+        buf = bytes(buf)
+        if baudrate > self.MAX_BAUDRATE:
+            buf = bytes(b ^ 0x5a for b in buf)
+        self.bytes += len(buf)
+        self.writes += 1
+        if machine.Pin._levels.get(self.dc, 0) == 0:
+            for command in buf:
+                self._start(command)
+        else:
+            self.data_bytes += len(buf)
+            self._data(buf)
+
+    def readinto(self, buf):
+        value = self.STATUS if self._command == 0x71 else 0x00
+        for i in range(len(buf)):
+            buf[i] = value
+
+    def _start(self, command):
+        self.commands[command] = self.commands.get(command, 0) + 1
+        self._command = command
+        self._args = bytearray()
+        self._pos = 0
+        if command in self.BUSY_MS:
+            self._busy_until = utime.ticks_add(utime.ticks_ms(), self.BUSY_MS[command])
+        if command == 0x12:
+            self.refreshes += 1
+            self.shown_black = bytes(self.black)
+            self.shown_red = bytes(self.red)
+        elif command == 0x91:
+            self._partial = True
+        elif command == 0x92:
+            self._partial = False
+
+    def _data(self, buf):
+        if self._command == 0x10:
+            self._store(self.black, buf)
+        elif self._command == 0x13:
+            self._store(self.red, buf)
+        else:
+            self._args.extend(buf)
+            if self._command == 0x90 and len(self._args) >= 8:
+                a = self._args
+                self._window = ((a[0] << 8 | a[1]) // 8, (a[2] << 8 | a[3]) // 8,
+                                a[4] << 8 | a[5], a[6] << 8 | a[7])
+
+    def _store(self, plane, buf):
+        if self._partial and self._window is not None:
+            x0, x1, y0, y1 = self._window
+            row_bytes = x1 - x0 + 1
+            for b in buf:
+                row, col = divmod(self._pos, row_bytes)
+                if y0 + row <= y1:
+                    plane[(y0 + row) * self.wide + x0 + col] = b
+                self._pos += 1
+        else:
+            end = min(self._pos + len(buf), len(plane))
+            plane[self._pos:end] = buf[:end - self._pos]
+            self._pos += len(buf)
+
+    def _frame(self):
+        if self.shown_black is None:
+            return self.black, self.red
+        return self.shown_black, self.shown_red
+
+    def save_pbm(self, path, plane='black'):
+        # Raw PBM: 1 = black. The black plane stores 1 for white.
+        black, red = self._frame()
+        data = bytes(0xff & ~b for b in black) if plane == 'black' else bytes(red)
+        with open(path, 'wb') as f:
+            f.write('P4\n{} {}\n'.format(self.width, self.height).encode())
+            f.write(data)
+
+    def save_png(self, path):
+        black, red = self._frame()
+        rows = bytearray()
+        for y in range(self.height):
+            rows.append(0)  # Filter type: none
+            base = y * self.wide
+            for x in range(self.width):
+                bit = 0x80 >> (x & 7)
+                if red[base + (x >> 3)] & bit:
+                    rows.extend(b'\xd0\x10\x10')
+                elif black[base + (x >> 3)] & bit:
+                    rows.extend(b'\xff\xff\xff')
+                else:
+                    rows.extend(b'\x00\x00\x00')
+
+        def chunk(kind, data):
+            body = kind + data
+            return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body) & 0xffffffff)
+
+        with open(path, 'wb') as f:
+            f.write(b'\x89PNG\r\n\x1a\n')
+            f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', self.width, self.height, 8, 2, 0, 0, 0)))
+            f.write(chunk(b'IDAT', zlib.compress(bytes(rows), 6)))
+            f.write(chunk(b'IEND', b''))
+
+    def report(self):
+        return {'bytes': self.bytes, 'data_bytes': self.data_bytes,
+                'transactions': self.transactions, 'writes': self.writes,
+                'refreshes': self.refreshes,
+                'commands': dict(sorted(self.commands.items()))}
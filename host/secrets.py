@@ -0,0 +1,14 @@
+# Host stand-in for the device's secrets.py. The URLs are served by the
+# canned responses in fixtures.py.
+
+WIFI_SSID = 'host'
+WIFI_PASSWORD = 'host'
+
+GARBAGE_TOKEN_URL = 'https://garbage.host/token'
+GARBAGE_SCHEDULE_URL = 'https://garbage.host/schedule?from={dt_start}&until={dt_end}'
+GARBAGE_CONSUMER = 'host'
+GARBAGE_SECRET = 'host'
+
+WEATHER_API_KEY = 'host'
+
+ICS_URL = 'https://ics.host/family.ics'
@@ -0,0 +1,41 @@
+# Host stand-in for uasyncio on top of CPython's asyncio.
+
+from asyncio import *  # noqa: F401,F403
+import asyncio as _asyncio
+
+
+async def sleep_ms(ms):
+    import utime
+    utime.sleep_ms(ms)
+    await _asyncio.sleep(0)
+
+
+class ThreadSafeFlag:
+    def __init__(self):
+        self._flag = False
+
+    def set(self):
+        self._flag = True
+
+    def clear(self):
+        self._flag = False
+
+    async def wait(self):
+        import machine
+        while not self._flag:
+            machine.idle()
+            await _asyncio.sleep(0)
+        self._flag = False
+
+
+async def wait_for_ms(aw, timeout):
+    # Timeout measured on the virtual clock, see utime.py
+    import utime
+    task = _asyncio.ensure_future(aw)
+    deadline = utime.ticks_add(utime.ticks_ms(), timeout)
+    while not task.done():
+        if utime.ticks_diff(deadline, utime.ticks_ms()) <= 0:
+            task.cancel()
+            raise TimeoutError
+        await _asyncio.sleep(0)
+    return task.result()
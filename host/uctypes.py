@@ -0,0 +1,10 @@
+# Host stand-in for uctypes. Raw memory access has no CPython equivalent;
+# only the colour Writer (CWriter) uses it.
+
+
+def addressof(obj):
+    raise NotImplementedError('uctypes.addressof is not available on the host')
+
+
+def bytearray_at(addr, size):
+    raise NotImplementedError('uctypes.bytearray_at is not available on the host')
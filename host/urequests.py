@@ -0,0 +1,49 @@
+# Host stand-in for urequests. Requests are answered by handlers registered
+# with route(); fixtures.py installs handlers for the calendar's services.
+
+import io
+import json as _json
+
+_routes = []
+
+
+def route(prefix, handler):
+    # handler(url) returns bytes, str or a JSON-serialisable object
+    _routes.insert(0, (prefix, handler))
+
+
+class Response:
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+        self.raw = io.BytesIO(content)
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return _json.loads(self.content)
+
+    def close(self):
+        self.raw.close()
+
+
+def request(method, url, data=None, json=None, headers=None, stream=None):
+    for prefix, handler in _routes:
+        if url.startswith(prefix):
+            body = handler(url)
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            elif not isinstance(body, (bytes, bytearray)):
+                body = _json.dumps(body).encode('utf-8')
+            return Response(bytes(body))
+    return Response(b'', 404)
+
+
+def get(url, **kw):
+    return request('GET', url, **kw)
+
+
+def post(url, **kw):
+    return request('POST', url, **kw)
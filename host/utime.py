@@ -0,0 +1,66 @@
+# Host stand-in for MicroPython's utime.
+#
+# Sleeps do not block: they advance a virtual clock that is added to the
+# ticks counters, so delays and panel busy times still show up in timings
+# while the host run completes in seconds.
+
+import time as _time
+
+_mktime = _time.mktime
+_perf_counter = _time.perf_counter
+
+_virtual_us = 0
+
+
+def _advance(us):
+    global _virtual_us
+    if us > 0:
+        _virtual_us += int(us)
+
+
+def sleep(seconds):
+    _advance(seconds * 1000000)
+
+
+def sleep_ms(ms):
+    _advance(ms * 1000)
+
+
+def sleep_us(us):
+    _advance(us)
+
+
+# Each counter wraps at 2**30 in its own unit, as on the device, so
+# ticks_diff() stays valid across the wrap
+
+def ticks_us():
+    return (int(_perf_counter() * 1000000) + _virtual_us) & 0x3fffffff
+
+
+def ticks_ms():
+    return (int(_perf_counter() * 1000) + _virtual_us // 1000) & 0x3fffffff
+
+
+def ticks_cpu():
+    return ticks_us()
+
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) & 0x3fffffff
+
+
+def ticks_diff(ticks1, ticks2):
+    diff = (ticks1 - ticks2) & 0x3fffffff
+    return diff - 0x40000000 if diff & 0x20000000 else diff
+
+
+localtime = _time.localtime
+time = _time.time
+
+
+def mktime(t):
+    # MicroPython accepts the 8-tuple returned by its localtime()
+    t = tuple(t)
+    if len(t) < 9:
+        t = t[:8] + (0,) * (8 - len(t)) + (-1,)
+    return int(_mktime(t))
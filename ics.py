@@ -0,0 +1,164 @@
+# Streaming iCalendar (ICS) event source
+#
+# Reads a feed line by line from a stream (an HTTP response's raw socket or
+# a file) and keeps only the VEVENTs that overlap a window of days, with
+# the few properties the calendar shows. Memory use does not depend on the
+# size of the feed: one unfolded line (capped at MAX_LINE) and the event
+# being parsed are held at a time, plus at most MAX_EVENTS kept events.
+#
+# Events are (first_day, last_day, summary), days being DateUtil day
+# numbers and last_day inclusive. Times are taken as local; TZID and UTC
+# offsets are not applied. Recurring events (RRULE, see recur.py) add one
+# event per occurrence in the window, less their EXDATEs.
+
+from calendar import DateUtil
+from recur import Recurrence
+
+
+class IcsSource:
+    MAX_LINE = 200      # Longer (unfolded) lines are cut, e.g. descriptions
+    MAX_EVENTS = 64
+    MAX_SUMMARY = 40
+
+    def __init__(self, first_day, last_day):
+        # Window of day numbers, both inclusive
+        self.first_day = first_day
+        self.last_day = last_day
+        self.events = []
+
+    @staticmethod
+    def for_month(dt_tuple):
+        # Source for the month of dt_tuple
+        year = dt_tuple[0]
+        month = dt_tuple[1]
+        first_day = DateUtil.days_from_civil(year, month, 1)
+        return IcsSource(first_day, first_day + DateUtil.month_length(year, month) - 1)
+
+    def fetch(self, url):
+        import urequests
+        r = urequests.get(url)
+        try:
+            if r.status_code != 200:
+                raise OSError('ICS feed returned {}'.format(r.status_code))
+            self.parse(r.raw)
+        finally:
+            r.close()
+        return self.events
+
+    @staticmethod
+    def _readline(stream):
+        # Next physical line, cut at MAX_LINE bytes. The rest of a longer
+        # line (e.g. an inline ATTACH) is read in MAX_LINE pieces and dropped.
+        raw = stream.readline(IcsSource.MAX_LINE)
+        rest = raw
+        while rest and rest[-1] != 10:
+            rest = stream.readline(IcsSource.MAX_LINE)
+        return raw
+
+    @staticmethod
+    def _lines(stream):
+        # Unfolded content lines: a line starting with a space or tab
+        # continues the previous one
+        line = None
+        while True:
+            raw = IcsSource._readline(stream)
+            if not raw:
+                break
+            if raw[0] in (32, 9):
+                if line is not None and len(line) < IcsSource.MAX_LINE:
+                    line += raw[1:IcsSource.MAX_LINE - len(line) + 1].rstrip(b'\r\n')
+                continue
+            if line is not None:
+                yield line
+            line = raw[:IcsSource.MAX_LINE].rstrip(b'\r\n')
+        if line is not None:
+            yield line
+
+    @staticmethod
+    def parse_date(value):
+        # (day number, minutes into the day) of DATE or DATE-TIME text
+        days = DateUtil.days_from_civil(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+        minutes = 0
+        if len(value) >= 13 and value[8:9] == b'T':
+            minutes = int(value[9:11]) * 60 + int(value[11:13])
+        return days, minutes
+
+    def parse(self, stream):
+        # depth: 0 outside a VEVENT, 1 in its own properties, more inside
+        # its components (VALARM, ...) whose properties are skipped
+        depth = 0
+        start = end = rule = None
+        summary = ''
+        exdates = []
+        for line in IcsSource._lines(stream):
+            if line.startswith(b'BEGIN:'):
+                if depth > 0:
+                    depth += 1
+                elif line == b'BEGIN:VEVENT':
+                    depth = 1
+                    start = end = rule = None
+                    summary = ''
+                    exdates = []
+                continue
+            if depth == 0:
+                continue
+            if line.startswith(b'END:'):
+                depth -= 1
+                if depth == 0 and start is not None:
+                    self._add(start, end, summary, rule, exdates)
+                continue
+            if depth > 1:
+                continue
+            colon = line.find(b':')
+            if colon < 0:
+                continue
+            name = line[:colon]
+            semicolon = name.find(b';')
+            if semicolon >= 0:
+                name = name[:semicolon]      # Parameters (VALUE=DATE, TZID=...) are ignored
+            value = line[colon + 1:]
+            try:
+                if name == b'DTSTART':
+                    start = IcsSource.parse_date(value)
+                elif name == b'DTEND':
+                    end = IcsSource.parse_date(value)
+                elif name == b'SUMMARY':
+                    summary = value[:IcsSource.MAX_SUMMARY].decode().replace('\\,', ',').replace('\\;', ';')
+                elif name == b'RRULE':
+                    rule = Recurrence.parse(value)
+                elif name == b'EXDATE':
+                    for exdate in value.split(b','):
+                        exdates.append(IcsSource.parse_date(exdate)[0])
+            except (ValueError, UnicodeError):
+                pass
+        self.events.sort()
+        return self.events
+
+    def _add(self, start, end, summary, rule=None, exdates=()):
+        first_day = start[0]
+        if end is None:
+            last_day = first_day
+        elif end[1] == 0 and end[0] > first_day:
+            last_day = end[0] - 1       # Ends at midnight (all-day DTEND is exclusive)
+        else:
+            last_day = end[0]
+        if rule is not None:
+            # One event per occurrence overlapping the window
+            length = last_day - first_day
+            for day in rule.starts(first_day, self.first_day - length, self.last_day):
+                if day not in exdates:
+                    self._keep((day, day + length, summary))
+            return
+        if last_day < self.first_day or first_day > self.last_day:
+            return
+        self._keep((first_day, last_day, summary))
+
+    def _keep(self, event):
+        events = self.events
+        if len(events) < IcsSource.MAX_EVENTS:
+            events.append(event)
+            return
+        # Full: keep the earliest events
+        latest = max(events)
+        if event < latest:
+            events[events.index(latest)] = event
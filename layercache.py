@@ -0,0 +1,62 @@
+# Static layer cache
+#
+# The calendar heading and day grid only change at midnight. After they are
+# rasterized, the rows they cover are saved from both planes as raw bytes,
+# with the hash of the display list operations that drew them as the key.
+# While the key matches, later cycles readinto() those rows straight into a
+# cleared Screen's planes and only draw the dynamic content on top.
+#
+# File: MAGIC, key length (u8), key, first and last row (u16 each), the
+# black plane rows, then the red plane rows.
+
+
+class LayerCache:
+    MAGIC = b'LC1'
+
+    def __init__(self, path='static_layer.bin'):
+        self.path = path
+
+    @staticmethod
+    def _header(key, first_row, last_row):
+        return LayerCache.MAGIC + bytes((len(key),)) + key + bytes(
+            (first_row & 0xff, first_row >> 8, last_row & 0xff, last_row >> 8))
+
+    def save(self, key, screen, first_row, last_row):
+        # Store rows first_row..last_row - 1 of both planes
+        start = first_row * screen.line_bytes
+        end = last_row * screen.line_bytes
+        with open(self.path, 'wb') as f:
+            f.write(LayerCache._header(key, first_row, last_row))
+            f.write(memoryview(screen.buffer_black)[start:end])
+            f.write(memoryview(screen.buffer_red)[start:end])
+
+    def load(self, key, screen):
+        # Read the stored rows into the planes if they were saved under key.
+        # False if there is no such layer.
+        try:
+            with open(self.path, 'rb') as f:
+                header = f.read(len(LayerCache.MAGIC) + 1 + len(key) + 4)
+                if header[:-4] != LayerCache._header(key, 0, 0)[:-4]:
+                    return False
+                first_row = header[-4] | header[-3] << 8
+                last_row = header[-2] | header[-1] << 8
+                if last_row > screen.height:
+                    return False
+                start = first_row * screen.line_bytes
+                end = last_row * screen.line_bytes
+                if (f.readinto(memoryview(screen.buffer_black)[start:end]) != end - start or
+                        f.readinto(memoryview(screen.buffer_red)[start:end]) != end - start):
+                    # Truncated: leave the planes blank for a redraw
+                    screen.imageblack.fill_rect(0, first_row, screen.width, last_row - first_row, 1)
+                    screen.imagered.fill_rect(0, first_row, screen.width, last_row - first_row, 0)
+                    return False
+            return True
+        except OSError:
+            return False
+
+    def invalidate(self):
+        try:
+            import os
+            os.remove(self.path)
+        except OSError:
+            pass
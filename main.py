@@ -1,12 +1,32 @@
+import gc
+from bufpool import BufferPool, largest_free
+
+band_rows = None  # Render in strips of this many rows to save RAM, None: full frame
+
+# Reserve the framebuffers before imports, TLS and JSON parsing fragment the
+# heap. One plane row is Screen.EPD_WIDTH // 8 bytes.
+PLANE_BYTES = 800 // 8 * (band_rows or 480)
+gc.collect()
+pool = BufferPool()
+pool.reserve('black', PLANE_BYTES)
+pool.reserve('red', PLANE_BYTES)
+
 from epaper import Screen
 from machine import RTC
+import machine
 import network
 import secrets
 import time
-import gc
 import micropython
 
 debugging = False
+clear_before_render = False  # Full clear refresh before each frame (ghosting)
+frame_store_path = 'last_frame.bin'  # Skip refreshing unchanged frames, None: off
+display_list_path = 'last_frame.dl'  # Skip rendering unchanged display lists, None: off
+atlas_path = 'atlas.bin'  # Pre-rendered labels, built when missing or stale, None: off
+static_layer_path = 'static_layer.bin'  # Cached calendar grid rows, None: off
+timing_log_path = 'panel_timing.jsonl'  # Append per-phase panel timings, None: off
+timing_log_max_bytes = 8192  # Then the log is moved to <path>.old and restarted
 
 led_yellow = machine.Pin(15, machine.Pin.OUT)
 button = machine.Pin(16, machine.Pin.IN, machine.Pin.PULL_DOWN)
@@ -19,10 +39,10 @@ wlan = network.WLAN(network.STA_IF)
 def print_mem_info(label=None):
     global debugging
     
+    # Free heap and largest allocatable block at a pipeline phase boundary
+    print('Memory at {}: free {}, largest block {}, pooled {}'.format(
+        label, gc.mem_free(), largest_free(), pool.size()))
     if debugging:
-        if label is not None:
-            print(label)
-        print('Free memory with buffers {}'.format(gc.mem_free()))
         micropython.mem_info(True)        
 
 def connect():
@@ -114,16 +134,60 @@ def snooze():
         del tfile
 
 
+def log_timing(timing):
+    # Print the panel phases and append them, with the firmware build, as
+    # one JSON line per cycle. The log is rotated so it and its .old copy
+    # never take more than twice timing_log_max_bytes of flash.
+    print('Panel timing:')
+    print(timing.report())
+    if not timing_log_path:
+        return
+    import json
+    import os
+    try:
+        if os.stat(timing_log_path)[6] >= timing_log_max_bytes:
+            try:
+                os.remove(timing_log_path + '.old')
+            except OSError:
+                pass
+            os.rename(timing_log_path, timing_log_path + '.old')
+    except OSError:
+        pass
+    tfile = open(timing_log_path, "a")
+    try:
+        tfile.write(json.dumps({'build': os.uname().version, 'phases': timing.record()}))
+        tfile.write('\n')
+    finally:
+        tfile.close()
+        del tfile
+
+
+def draw_layered(epd, frame, static_ops):
+    # Rasterize the frame, taking its first static_ops operations (the
+    # calendar grid) from the static layer cache when they are unchanged
+    if not static_layer_path:
+        frame.replay(epd)
+        return
+    from layercache import LayerCache
+    layers = LayerCache(static_layer_path)
+    key = frame.hash(0, static_ops)
+    if layers.load(key, epd):
+        print('Static layer loaded')
+    else:
+        frame.replay(epd, 0, static_ops)
+        first_row, last_row = frame.rows(0, static_ops)
+        layers.save(key, epd, first_row, last_row)
+    frame.replay(epd, static_ops)
+
+
 def calendar_update():
     global wlan
     global rtc
     
-    #ebb = bytearray(Screen.EPD_WIDTH * Screen.EPD_HEIGHT // 8)
-    #erb = bytearray(Screen.EPD_WIDTH * Screen.EPD_HEIGHT // 8)
-    ebb = None
-    erb = None
+    ebb = pool.get('black')
+    erb = pool.get('red')
 
-    print_mem_info()
+    print_mem_info('start')
 
     connect()
     
@@ -159,7 +223,7 @@ def calendar_update():
 
         gc.collect()
         
-        print_mem_info('1')
+        print_mem_info('date/time')
 
         from garbage import Garbage
         # Get garbage schedule
@@ -172,7 +236,7 @@ def calendar_update():
         
         gc.collect()
         
-        print_mem_info('2')
+        print_mem_info('garbage token')
        
         print(' - getting schedule...')
         schedule = garbage.get_schedule(dt)
@@ -184,7 +248,7 @@ def calendar_update():
         
         gc.collect()
         
-        print_mem_info('3')
+        print_mem_info('garbage schedule')
         
         from weather import Weather
         
@@ -195,28 +259,87 @@ def calendar_update():
         del weather
         del Weather
         
-        disconnect()
-        
         gc.collect()
         
-        print_mem_info('4')
+        print_mem_info('weather')
+        
+        # Get calendar events, streamed so the feed never sits in RAM
+        events = []
+        ics_url = getattr(secrets, 'ICS_URL', None)
+        if ics_url:
+            from ics import IcsSource
+            print('Getting calendar events...')
+            try:
+                events = IcsSource.for_month(dt).fetch(ics_url)
+                print('{} events this month'.format(len(events)))
+            except Exception as e:
+                # Optional: draw the rest without events
+                import sys
+                print('Calendar events unavailable:')
+                sys.print_exception(e)
+                events = []
+            
+            del IcsSource
+            
+            gc.collect()
+            
+            print_mem_info('events')
         
         # Draw calendar
         from calendar import Calendar
-        epd = Screen(ebb, erb)        
+        from displaylist import DisplayList
+        from framestore import FrameStore
+        frame_store = FrameStore(frame_store_path) if frame_store_path else None
+        atlas = None
+        if atlas_path:
+            from atlas import Atlas
+            atlas = Atlas(atlas_path)
+            labels = Calendar.atlas_labels()
+            key = Atlas.key(labels)
+            if not atlas.load(key):
+                print('Building label atlas...')
+                Atlas.build(atlas_path, labels, key)
+                atlas.load(key)
+            del labels
+        epd = Screen(ebb, erb, frame_store, band_rows, atlas=atlas)        
         try:
-            epd.Clear()
+            # Measure SPI rates once and keep the fastest reliable one
+            if not epd.transport.configured:
+                epd.transport.self_test(epd)
             
-            calendar = Calendar(epd, dt)
+            # Record the frame once, then rasterize it by replaying the list
+            frame = DisplayList(epd.width, epd.height)
+            calendar = Calendar(frame, dt)
             calendar.draw_calendar()
+            static_ops = len(frame)  # The rest of the frame changes every cycle
             calendar.draw_garbage(schedule)
             calendar.draw_weather(forecast)
+            calendar.draw_events(events)
             calendar.draw_announcements()
             calendar.draw_last_updated()
             
             important_announcement = calendar.announce_gs_tomorrow
             
-            epd.display()
+            previous = DisplayList.load(display_list_path) if display_list_path else None
+            print('Frame of {} operations, changed regions: {}'.format(len(frame), frame.changed_regions(previous)))
+            
+            # Disconnect and log while the panel refreshes
+            if previous is not None and previous.hash() == frame.hash() and not clear_before_render:
+                print('Frame unchanged, rendering skipped')
+                transfer_ms = 0
+            elif band_rows:
+                transfer_ms = epd.render_bands(lambda: frame.replay(epd), pre_clear=clear_before_render, wait=False)
+            else:
+                draw_layered(epd, frame, static_ops)
+                print_mem_info('draw')
+                transfer_ms = epd.display(pre_clear=clear_before_render, wait=False)
+            
+            disconnect()
+            print('Frame transferred in {} ms, changed regions: {}'.format(transfer_ms, epd.changed))
+            epd.WaitUntilIdle()
+            if display_list_path:
+                frame.save(display_list_path)
+            print_mem_info('display')
             epd.delay_ms(500)
                 
             epd.delay_ms(2000)
@@ -224,7 +347,10 @@ def calendar_update():
         finally:
             print("Screen sleep")
             epd.sleep()
+            if atlas is not None:
+                atlas.close()
         
+        log_timing(epd.timing)
         print('All done')
     return important_announcement
         
@@ -295,56 +421,58 @@ def light_sleep_long(duration_seconds, ignore_button=False):
     return True
             
 
-micropython.alloc_emergency_exception_buf(100)
-(r, e) = calendar_cycle()
-notification = r
-error = e
-sleep_time = 60 * 60 * 4
+# Not run when imported, e.g. by the host stand-ins (host/)
+if __name__ == '__main__':
+    micropython.alloc_emergency_exception_buf(100)
+    (r, e) = calendar_cycle()
+    notification = r
+    error = e
+    sleep_time = 60 * 60 * 4
 
-disconnect()
+    disconnect()
 
-if not error and not notification:
-    print('Sleeping...')
-    # time.sleep(sleep_time)
-    light_sleep_long(sleep_time)
+    if not error and not notification:
+        print('Sleeping...')
+        # time.sleep(sleep_time)
+        light_sleep_long(sleep_time)
     
-elif not error and notification:
-    print('Notification...')
+    elif not error and notification:
+        print('Notification...')
     
-    already_alarmed = was_there_alarm_today()    
-    while sleep_time > 0:
-        led_yellow.value(0)
-        result = light_sleep_long(5)
-        if not result:
-            snooze()
-            break
-        
-        if not already_alarmed: light_if_allowed()        
-        result = light_sleep_long(2)
-        if not result:
-            snooze()
-            break
-        sleep_time -= 7
+        already_alarmed = was_there_alarm_today()    
+        while sleep_time > 0:
+            led_yellow.value(0)
+            result = light_sleep_long(5)
+            if not result:
+                snooze()
+                break
+        
+            if not already_alarmed: light_if_allowed()        
+            result = light_sleep_long(2)
+            if not result:
+                snooze()
+                break
+            sleep_time -= 7
         
-    led_yellow.value(0)
+        led_yellow.value(0)
     
-    if sleep_time > 0:
-        light_sleep_long(10, True)
-        sleep_time -= 10
-        light_sleep_long(sleep_time)
+        if sleep_time > 0:
+            light_sleep_long(10, True)
+            sleep_time -= 10
+            light_sleep_long(sleep_time)
    
-else:
-    print('Error...')
+    else:
+        print('Error...')
     
-    sleep_time = 60 * 60 * 1
+        sleep_time = 60 * 60 * 1
     
-    while sleep_time > 0:
-        light_if_allowed()
-        result = light_sleep_long(2)
-        led_yellow.value(0)
-        if not result: break
-        result = light_sleep_long(2)
-        if not result: break
-        sleep_time -= 2
-        
-machine.reset()
\ No newline at end of file
+        while sleep_time > 0:
+            light_if_allowed()
+            result = light_sleep_long(2)
+            led_yellow.value(0)
+            if not result: break
+            result = light_sleep_long(2)
+            if not result: break
+            sleep_time -= 2
+        
+    machine.reset()
\ No newline at end of file
@@ -0,0 +1,185 @@
+# Recurrence expansion and per-day indexing
+#
+# Recurrence expands an RRULE into the days its occurrences start on, but
+# only within a window of days: it jumps to the first period that can reach
+# the window with integer arithmetic instead of stepping through every
+# occurrence since DTSTART, and stops at the end of the window.
+#
+# Supported: FREQ=DAILY, WEEKLY (BYDAY), MONTHLY (BYMONTHDAY, or BYDAY with
+# ordinals such as 2TU or -1FR) and YEARLY (DTSTART's day), with INTERVAL,
+# COUNT and UNTIL. Weeks start on Monday. Other parts (BYMONTH, BYSETPOS,
+# WKST, ...) are ignored.
+#
+# DayIndex files spans of days by day of the month, so the calendar looks
+# up what happens on a day instead of scanning its lists for every cell.
+
+from array import array
+from calendar import DateUtil
+
+
+class Recurrence:
+    DAILY = 0
+    WEEKLY = 1
+    MONTHLY = 2
+    YEARLY = 3
+    FREQS = {b'DAILY': DAILY, b'WEEKLY': WEEKLY, b'MONTHLY': MONTHLY, b'YEARLY': YEARLY}
+    WEEKDAYS = (b'MO', b'TU', b'WE', b'TH', b'FR', b'SA', b'SU')
+
+    def __init__(self, freq, interval=1, count=None, until=None, byday=(), bymonthday=()):
+        self.freq = freq
+        self.interval = max(interval, 1)
+        self.count = count          # Number of occurrences, or None
+        self.until = until          # Last day number, inclusive, or None
+        self.byday = byday          # (ordinal, weekday) pairs, ordinal 0 for every week
+        self.bymonthday = bymonthday
+
+    @staticmethod
+    def parse(value):
+        # Recurrence of an RRULE value, e.g. b'FREQ=WEEKLY;INTERVAL=2;BYDAY=TU'
+        parts = {}
+        for part in value.split(b';'):
+            equals = part.find(b'=')
+            if equals > 0:
+                parts[part[:equals]] = part[equals + 1:]
+        freq = Recurrence.FREQS.get(parts.get(b'FREQ'))
+        if freq is None:
+            raise ValueError('Unsupported FREQ')
+        byday = []
+        for day in parts.get(b'BYDAY', b'').split(b','):
+            if len(day) >= 2:
+                ordinal = int(day[:-2]) if len(day) > 2 else 0
+                byday.append((ordinal, Recurrence.WEEKDAYS.index(day[-2:])))
+        bymonthday = [int(day) for day in parts.get(b'BYMONTHDAY', b'').split(b',') if day]
+        until = parts.get(b'UNTIL')
+        if until is not None:
+            until = DateUtil.days_from_civil(int(until[0:4]), int(until[4:6]), int(until[6:8]))
+        count = parts.get(b'COUNT')
+        return Recurrence(freq, int(parts.get(b'INTERVAL', b'1')),
+                          None if count is None else int(count), until, byday, bymonthday)
+
+    def starts(self, start, first, last):
+        # Day numbers, ascending, of the occurrences of an event starting on
+        # day start that start within first..last
+        if self.until is not None:
+            last = min(last, self.until)
+        if last < start:
+            return
+        if self.freq == Recurrence.DAILY:
+            days = self._daily(start, first, last)
+        elif self.freq == Recurrence.WEEKLY:
+            days = self._weekly(start, first, last)
+        else:
+            step = 12 * self.interval if self.freq == Recurrence.YEARLY else self.interval
+            days = self._monthly(start, first, last, step)
+        for n, day in days:
+            if day > last or (self.count is not None and n >= self.count):
+                return
+            if day >= first:
+                yield day
+
+    # The generators below yield (occurrence number, day) from the first
+    # period that can reach first on, until a period starts after last
+
+    def _daily(self, start, first, last):
+        n = max(0, (first - start) // self.interval)
+        while start + n * self.interval <= last:
+            yield n, start + n * self.interval
+            n += 1
+
+    def _weekly(self, start, first, last):
+        weekdays = sorted(set(weekday for _, weekday in self.byday)) or [(start + 3) % 7]
+        week = start - (start + 3) % 7     # Monday of DTSTART's week
+        skipped = 0     # Days of the first week before DTSTART
+        for weekday in weekdays:
+            if week + weekday < start:
+                skipped += 1
+        step = 7 * self.interval
+        period = max(0, (first - week) // step)
+        while week + period * step <= last:
+            for i in range(len(weekdays)):
+                day = week + period * step + weekdays[i]
+                if day >= start:
+                    yield period * len(weekdays) + i - skipped, day
+            period += 1
+
+    def _month_days(self, year, month, mday):
+        # Days of the month the rule picks, ascending
+        length = DateUtil.month_length(year, month)
+        days = []
+        if self.bymonthday:
+            for day in self.bymonthday:
+                days.append(day if day > 0 else length + day + 1)
+        elif self.byday and self.freq == Recurrence.MONTHLY:
+            first_weekday = (DateUtil.days_from_civil(year, month, 1) + 3) % 7
+            for ordinal, weekday in self.byday:
+                day = (weekday - first_weekday) % 7 + 1    # First such weekday
+                if ordinal > 0:
+                    days.append(day + 7 * (ordinal - 1))
+                elif ordinal < 0:
+                    days.append(day + 7 * ((length - day) // 7 + ordinal + 1))
+                else:
+                    days.extend(range(day, length + 1, 7))
+        else:
+            days.append(mday)
+        return sorted(set(day for day in days if 1 <= day <= length))
+
+    def _monthly(self, start, first, last, step):
+        year, month, mday = DateUtil.civil_from_days(start)
+        months = year * 12 + month - 1
+        period = 0
+        if self.count is None:
+            # Numbering only matters with COUNT, otherwise skip ahead
+            first_year, first_month, _ = DateUtil.civil_from_days(first)
+            period = max(0, (first_year * 12 + first_month - 1 - months) // step)
+        n = 0
+        while True:
+            year, month = divmod(months + period * step, 12)
+            month_first = DateUtil.days_from_civil(year, month + 1, 1)
+            if month_first > last:
+                return
+            for day in self._month_days(year, month + 1, mday):
+                day += month_first - 1
+                if day >= start:
+                    yield n, day
+                    n += 1
+            period += 1
+
+
+class DayIndex:
+    # Items on each day of a month: those of day d are
+    # items[offsets[d - 1]:offsets[d]], and bit d of mask is set if there
+    # are any
+
+    def __init__(self, first_day, days, spans):
+        # spans: list of (first_day, last_day, item), item an int < 65536
+        last_day = first_day + days - 1
+        offsets = array('H', bytes(2 * (days + 1)))
+        for span_first, span_last, _ in spans:
+            for day in range(max(span_first, first_day), min(span_last, last_day) + 1):
+                offsets[day - first_day + 1] += 1
+        mask = 0
+        for mday in range(1, days + 1):
+            if offsets[mday]:
+                mask |= 1 << mday
+            offsets[mday] += offsets[mday - 1]
+        items = array('H', bytes(2 * offsets[days]))
+        fill = array('H', offsets)
+        for span_first, span_last, item in spans:
+            for day in range(max(span_first, first_day), min(span_last, last_day) + 1):
+                mday = day - first_day
+                items[fill[mday]] = item
+                fill[mday] += 1
+        self.first_day = first_day
+        self.days = days
+        self.offsets = offsets
+        self.items = items
+        self.mask = mask
+
+    def has(self, mday):
+        return self.mask & (1 << mday) != 0
+
+    def on(self, mday):
+        # Items on day mday (1-based), in the order of spans
+        if not 1 <= mday <= self.days:
+            return self.items[0:0]
+        return self.items[self.offsets[mday - 1]:self.offsets[mday]]
@@ -0,0 +1,46 @@
+# Per-phase timing of the panel side of a cycle
+#
+# Screen brackets each phase (reset, init, plane transfers, refresh, sleep)
+# with begin()/end() and counts every byte it puts on the SPI bus in
+# PhaseTimer.bytes. Phases may nest (init contains reset) and repeat (a
+# pre-clear and the frame both transfer planes); repeats are accumulated.
+# record() returns plain lists and dicts, ready to log as JSON and compare
+# across firmware builds.
+
+import utime
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.bytes = 0      # Bytes sent so far, incremented by Screen
+        self.phases = []    # [name, microseconds, bytes, count] in first-seen order
+
+    def clear(self):
+        self.bytes = 0
+        self.phases = []
+
+    def begin(self):
+        return utime.ticks_us(), self.bytes
+
+    def end(self, name, mark):
+        us = utime.ticks_diff(utime.ticks_us(), mark[0])
+        sent = self.bytes - mark[1]
+        for phase in self.phases:
+            if phase[0] == name:
+                phase[1] += us
+                phase[2] += sent
+                phase[3] += 1
+                return us
+        self.phases.append([name, us, sent, 1])
+        return us
+
+    def record(self):
+        return [{'phase': name, 'us': us, 'bytes': sent, 'count': count}
+                for name, us, sent, count in self.phases]
+
+    def report(self):
+        lines = []
+        for name, us, sent, count in self.phases:
+            lines.append('{:<10} {:>9} us {:>7} bytes{}'.format(
+                name, us, sent, ' x{}'.format(count) if count > 1 else ''))
+        return '\n'.join(lines)
@@ -0,0 +1,92 @@
+# SPI transport settings for the panel
+#
+# Owns the SPI bus the Screen talks through, with a configurable baud rate
+# and chunk size (bytes per spi.write() when streaming planes and fills).
+# self_test() measures the throughput of each candidate rate and checks the
+# controller still understands commands sent at that rate. The check only
+# covers single-byte commands, not the 48 KB planes, so the rate saved to
+# flash (and used by every later Screen) is one step below the fastest that
+# passed, and no candidate goes past the UC8179's rated 20 MHz write clock.
+
+from machine import SPI
+import utime
+
+
+class Transport:
+    CONFIG_PATH = 'spi_config.json'
+    DEFAULT_BAUDRATE = 4000_000
+    DEFAULT_CHUNK = 4096
+    RATES = (4000_000, 8000_000, 10_000_000, 16_000_000, 20_000_000)    # Up to the rated SCL
+    TEST_BYTES = 9600   # Streamed per candidate rate
+
+    def __init__(self, spi_id=1, baudrate=None, chunk=None, path=CONFIG_PATH):
+        self.path = path
+        self.configured = False     # Settings came from a saved self-test
+        self.baudrate = Transport.DEFAULT_BAUDRATE
+        self.chunk = Transport.DEFAULT_CHUNK
+        self.load()
+        if baudrate is not None:
+            self.baudrate = baudrate
+        if chunk is not None:
+            self.chunk = chunk
+        self.spi = SPI(spi_id)
+        self.spi.init(baudrate=self.baudrate)
+
+    def set_baudrate(self, baudrate):
+        self.baudrate = baudrate
+        self.spi.init(baudrate=baudrate)
+
+    def load(self):
+        import json
+        try:
+            with open(self.path, 'r') as f:
+                config = json.load(f)
+            self.baudrate = int(config['baudrate'])
+            self.chunk = int(config['chunk'])
+            self.configured = True
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def save(self):
+        import json
+        with open(self.path, 'w') as f:
+            json.dump({'baudrate': self.baudrate, 'chunk': self.chunk}, f)
+        self.configured = True
+
+    def self_test(self, screen, rates=None):
+        # Stream TEST_BYTES into the black plane RAM at each rate (nothing
+        # is refreshed) and time it, then power the controller off and on
+        # at that rate and check it answers with BUSY both times. Rates are
+        # tried from slow to fast and the test stops at the first failure;
+        # the rate before the fastest reliable one is kept as a margin.
+        # Returns [(baudrate, bytes per second, reliable)].
+        results = []
+        passed = []
+        for rate in rates or Transport.RATES:
+            self.set_baudrate(rate)
+            start = utime.ticks_us()
+            screen.send_command(0x10)
+            screen.send_fill(0xff, Transport.TEST_BYTES)
+            elapsed = max(utime.ticks_diff(utime.ticks_us(), start), 1)
+            bps = Transport.TEST_BYTES * 1000000 // elapsed
+            reliable = screen.busy_handshake(0x02) and screen.busy_handshake(0x04)
+            results.append((rate, bps, reliable))
+            print('SPI at {} Hz: {} bytes/s, {}'.format(rate, bps, 'ok' if reliable else 'failed'))
+            if not reliable:
+                break
+            passed.append(rate)
+
+        if len(passed) >= 2:
+            best = passed[-2]
+        elif passed:
+            best = passed[0]
+        else:
+            best = Transport.DEFAULT_BAUDRATE
+        self.set_baudrate(best)
+        self.save()
+        # A failed rate may have left the controller confused, and its plane
+        # RAM no longer holds the last frame
+        screen.init()
+        if screen.frame_store is not None:
+            screen.frame_store.invalidate()
+        return results
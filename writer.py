@@ -21,6 +21,8 @@
 
 
 import framebuf
+from array import array
+from collections import OrderedDict
 from uctypes import bytearray_at, addressof
 from sys import implementation
 import os
@@ -43,6 +45,12 @@ def _get_id(device):
 class Writer():
 
     state = {}  # Holds a display state for each device
+    # Ready-to-blit glyph FrameBuffers shared by all Writers, least recently
+    # used first. Key: (font, char, invert, clip_width).
+    glyph_cache = OrderedDict()
+    glyph_cache_size = 64
+    # font -> (advance widths, true widths) of its glyph slots, see _widths()
+    width_tables = {}
 
     @staticmethod
     def set_textpos(device, row=None, col=None):
@@ -77,6 +85,12 @@ class Writer():
             fstr = 'Orientation: Horizontal. Reversal: {}. Width: {}. Height: {}.'
             print(fstr.format(font.reverse(), device.width, device.height))
             print('Start row = {} col = {}'.format(self._getstate().text_row, self._getstate().text_col))
+        # Glyph slot of ord(char): 1 + ord(char) - min_ch, 0 for the default
+        self.min_ch = font.min_ch()
+        self.max_ch = font.max_ch()
+        self.widths, self.true_widths = self._widths(font)
+        # Run-length glyphs (fontgen.py rle=True) are drawn by _printruns()
+        self.rle = hasattr(font, 'rle') and font.rle()
         self.screenwidth = device.width  # In pixels
         self.screenheight = device.height
         self.bgcolor = 0  # Monochrome background and foreground colors
@@ -92,6 +106,21 @@ class Writer():
         self.char_width = 0
         self.clip_width = 0
 
+    @staticmethod
+    def _widths(font):
+        # Per-slot advance and true width tables: precomputed by the font
+        # when it has them, built once from its glyphs otherwise
+        tables = Writer.width_tables.get(font)
+        if tables is None:
+            if hasattr(font, 'widths'):
+                tables = (font.widths(), font.true_widths())
+            else:
+                chars = [chr(0)] + [chr(c) for c in range(font.min_ch(), font.max_ch() + 1)]
+                tables = (array('B', [font.get_ch(c)[2] for c in chars]),
+                          array('B', [Writer._glyph_truelen(*font.get_ch(c)) for c in chars]))
+            Writer.width_tables[font] = tables
+        return tables
+
     def _getstate(self):
         return Writer.state[self.devid]
 
@@ -123,54 +152,110 @@ class Writer():
 
     def printstring(self, string, invert=False):
         # word wrapping. Assumes words separated by single space.
-        q = string.split('\n')
-        last = len(q) - 1
-        for n, s in enumerate(q):
-            if s:
-                self._printline(s, invert)
-            if n != last:
-                self._printchar('\n')
-
-    def _printline(self, string, invert):
-        rstr = None
-        if self.wrap and self.stringlen(string, True):  # Length > self.screenwidth
-            pos = 0
-            lstr = string[:]
-            while self.stringlen(lstr, True):  # Length > self.screenwidth
-                pos = lstr.rfind(' ')
-                lstr = lstr[:pos].rstrip()
-            if pos > 0:
-                rstr = string[pos + 1:]
-                string = lstr
-                
-        for char in string:
-            self._printchar(char, invert)
-        if rstr is not None:
+        start = 0
+        while True:
+            end = string.find('\n', start)
+            if end < 0:
+                self._printline(string, invert, start, len(string))
+                return
+            self._printline(string, invert, start, end)
             self._printchar('\n')
-            self._printline(rstr, invert)  # Recurse
+            start = end + 1
+
+    def _printline(self, string, invert, start=0, end=None):
+        # Render string[start:end] line by line, without slicing it
+        for n, (first, last, _) in enumerate(self.breaklines(string, start, end)):
+            if n:
+                self._printchar('\n')
+            for i in range(first, last):
+                self._printchar(string[i], invert)
+
+    def breaklines(self, string, start=0, end=None):
+        # Word wrap string[start:end] from the current column in one pass over
+        # cumulative widths. Returns [(start, end, width)] line spans, width
+        # being the sum of advances. A line breaks at the last space of a run
+        # of spaces (the run is dropped) where the text before the run still
+        # fits, its last glyph counting only its true width. A line with no
+        # such break is left whole, for _printchar to clip or wrap.
+        if end is None:
+            end = len(string)
+        widths = self.widths
+        true_widths = self.true_widths
+        lo = self.min_ch
+        hi = self.max_ch
+        wd = self.screenwidth
+        sc = self._getstate().text_col  # Start column
+        spans = []
+        while True:
+            l = 0  # Advance of string[start:i]
+            edge = 0  # Printed width of string[start:i]
+            word_edge = 0  # Printed width up to the last non-space
+            brk = -1  # Last space of the best break so far
+            brk_end = start
+            brk_width = 0
+            fits = True
+            i = start
+            while i < end:
+                o = ord(string[i])
+                slot = o - lo + 1 if lo <= o <= hi else 0
+                if o == 32:
+                    if i == start or string[i - 1] != ' ':  # A run of spaces starts
+                        if i > start and sc + word_edge > wd:
+                            fits = False
+                            break  # Longer lines won't fit either
+                        run_end = i
+                        run_width = l
+                    if i + 1 == end or string[i + 1] != ' ':  # Last space of the run
+                        brk = i
+                        brk_end = run_end
+                        brk_width = run_width
+                else:
+                    word_edge = l + true_widths[slot]
+                edge = l + true_widths[slot]
+                l += widths[slot]
+                i += 1
+            if fits and sc + edge <= wd or not self.wrap or brk <= start:
+                while i < end:  # Rest of an unwrapped line
+                    o = ord(string[i])
+                    l += widths[o - lo + 1 if lo <= o <= hi else 0]
+                    i += 1
+                spans.append((start, end, l))
+                return spans
+            spans.append((start, brk_end, brk_width))
+            start = brk + 1
+            sc = 0
 
     def stringlen(self, string, oh=False):
         if not len(string):
             return 0
         sc = self._getstate().text_col  # Start column
         wd = self.screenwidth
+        widths = self.widths
+        lo = self.min_ch
+        hi = self.max_ch
         l = 0
-        for char in string[:-1]:
-            _, _, char_width = self.font.get_ch(char)
-            l += char_width
+        last = len(string) - 1
+        for i in range(last):
+            o = ord(string[i])
+            l += widths[o - lo + 1 if lo <= o <= hi else 0]
             if oh and l + sc > wd:
                 return True  # All done. Save time.
-        char = string[-1]
-        _, _, char_width = self.font.get_ch(char)
+        o = ord(string[last])
+        slot = o - lo + 1 if lo <= o <= hi else 0
+        char_width = widths[slot]
         if oh and l + sc + char_width > wd:
-            l += self._truelen(char)  # Last char might have blank cols on RHS
+            l += self.true_widths[slot]  # Last char might have blank cols on RHS
         else:
             l += char_width  # Public method. Return same value as old code.
         return l + sc > wd if oh else l
 
     # Return the printable width of a glyph less any blank columns on RHS
     def _truelen(self, char):
-        glyph, ht, wd = self.font.get_ch(char)
+        o = ord(char)
+        return self.true_widths[o - self.min_ch + 1 if self.min_ch <= o <= self.max_ch else 0]
+
+    @staticmethod
+    def _glyph_truelen(glyph, ht, wd):
         div, mod = divmod(wd, 8)
         gbytes = div + 1 if mod else div  # No. of bytes per row of glyph
         mc = 0  # Max non-blank column
@@ -187,7 +272,6 @@ class Writer():
                     break
             if mc + 1 == wd:
                 break  # All done: no trailing space
-        # print('Truelen', char, wd, mc + 1)  # TEST 
         return mc + 1
 
     def _get_char(self, char, recurse):
@@ -235,15 +319,51 @@ class Writer():
         self._get_char(char, recurse)
         if self.glyph is None:
             return  # All done
-        buf = bytearray(self.glyph)
-        if invert:
-            for i, v in enumerate(buf):
-                buf[i] = 0xFF & ~ v
-        fbc = framebuf.FrameBuffer(buf, self.clip_width, self.char_height, self.map)
+        if self.rle:
+            self._printruns(s, invert)
+            s.text_col += self.char_width
+            self.cpos += 1
+            return
+        cache = Writer.glyph_cache
+        key = (self.font, char, invert, self.clip_width)
+        fbc = cache.pop(key, None)
+        if fbc is None:
+            buf = bytearray(self.glyph)
+            if invert:
+                for i, v in enumerate(buf):
+                    buf[i] = 0xFF & ~ v
+            fbc = framebuf.FrameBuffer(buf, self.clip_width, self.char_height, self.map)
+            if len(cache) >= Writer.glyph_cache_size:
+                cache.pop(next(iter(cache)))
+        cache[key] = fbc  # Most recently used
         self.device.blit(fbc, s.text_col, s.text_row)
         s.text_col += self.char_width
         self.cpos += 1
 
+    # Draw a run-length glyph straight onto the device: clear the glyph box,
+    # then one fill_rect per run and band of identical rows
+    def _printruns(self, s, invert):
+        fg = 0 if invert else 1
+        x = s.text_col
+        y = s.text_row
+        clip = self.clip_width
+        device = self.device
+        device.fill_rect(x, y, clip, self.char_height, 1 - fg)
+        glyph = self.glyph
+        i = 0
+        end = len(glyph)
+        while i < end:
+            rows = glyph[i]
+            runs = glyph[i + 1]
+            i += 2
+            while runs:
+                start = glyph[i]
+                if start < clip:
+                    device.fill_rect(x + start, y, min(glyph[i + 1], clip - start), rows, fg)
+                i += 2
+                runs -= 1
+            y += rows
+
     def tabsize(self, value=None):
         if value is not None:
             self.tab = value